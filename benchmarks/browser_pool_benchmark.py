@@ -0,0 +1,74 @@
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Allow importing from the src directory
+sys.path.append(str(Path(__file__).parent.parent))
+
+from loguru import logger
+from src.factory import run_etl
+from src.scraper import scrape_url, AsyncWebScraper
+from src.fetch_cache import get_fetch_cache
+
+
+def get_sample_urls(client, limit):
+    sql = client.connection.get_sql_from_file('select_unscraped_urls.sql')
+    sql = sql.format(shop=client.SHOP, table_name="urls")
+    return client.connection.extract_from_sql(sql)["url"].head(limit).tolist()
+
+
+async def run_pages(client, urls, scraper=None):
+    start = time.perf_counter()
+    n_success = 0
+
+    for url in urls:
+        soup = await scrape_url(
+            url,
+            client.SELECTOR_SCRAPE_PRODUCT_INFO,
+            client.with_proxy,
+            wait_until=client.wait_until,
+            min_sec=0,
+            max_sec=0,
+            browser=client.browser_type,
+            scraper=scraper
+        )
+        if soup is not None:
+            n_success += 1
+
+    elapsed = time.perf_counter() - start
+    return n_success, elapsed
+
+
+async def benchmark(shop, limit):
+    client = run_etl(shop)
+    urls = get_sample_urls(client, limit)
+
+    # Both passes load the same URLs, so the second must not read the first's pages from disk
+    get_fetch_cache().ttl = 0
+    logger.info(f"Benchmarking {len(urls)} {shop} URL(s)")
+
+    results = {}
+    results["one browser per URL"] = await run_pages(client, urls)
+
+    async with AsyncWebScraper() as scraper:
+        scraper.empty_listing_texts = ()
+        results["persistent browser pool"] = await run_pages(
+            client, urls, scraper)
+
+    for label, (n_success, elapsed) in results.items():
+        pages_per_minute = n_success / elapsed * 60 if elapsed else 0
+        print(f"{label:<28} {n_success:>4}/{len(urls)} pages "
+              f"in {elapsed:8.2f}s -> {pages_per_minute:6.2f} pages/min")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare pages/minute of one-off browsers against the persistent browser pool.")
+    parser.add_argument("shop", help="Shop name as registered in src.factory.SHOPS")
+    parser.add_argument("--limit", type=int, default=40,
+                        help="Number of unscraped product URLs to fetch")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.shop, args.limit))
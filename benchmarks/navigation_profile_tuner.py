@@ -0,0 +1,123 @@
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+# Allow importing from the src directory
+sys.path.append(str(Path(__file__).parent.parent))
+
+from loguru import logger
+from src.factory import SHOPS, run_etl
+from src.etl import frames_match
+from src.scraper import scrape_url, AsyncWebScraper
+from src.fetch_cache import get_fetch_cache
+
+WAIT_UNTIL_MODES = ("domcontentloaded", "load", "networkidle")
+ENGINES = ("chromium", "firefox")
+
+
+def get_sample_urls(client, limit):
+    sql = client.connection.get_sql_from_file('select_unscraped_urls.sql')
+    sql = sql.format(shop=client.SHOP, table_name="urls")
+    return client.connection.extract_from_sql(sql)["url"].head(limit).tolist()
+
+
+async def run_profile(client, urls, wait_until, engine):
+    """Transform output and load time of each URL under one profile"""
+    frames = {}
+    timings = []
+
+    async with AsyncWebScraper() as scraper:
+        scraper.use_resource_policy(client.resource_policy, client.BASE_URL)
+        scraper.empty_listing_texts = ()
+        for url in urls:
+            start = time.perf_counter()
+            page = await scrape_url(
+                url,
+                client.SELECTOR_SCRAPE_PRODUCT_INFO,
+                client.with_proxy,
+                wait_until=wait_until,
+                min_sec=0,
+                max_sec=0,
+                browser=engine,
+                scraper=scraper,
+                parse_only=client.get_parse_only(),
+                parse=client.get_parse(),
+                keep_selectors=client.get_keep_selectors()
+            )
+            elapsed = time.perf_counter() - start
+            if not page:
+                continue
+
+            timings.append(elapsed)
+            try:
+                frames[url] = await client.transform_async(page, url)
+            except Exception as e:
+                logger.warning(f"Transform failed on {url}: {e}")
+
+    return frames, timings
+
+
+async def tune(shop, limit, dry_run):
+    client = run_etl(shop)
+    urls = get_sample_urls(client, limit)
+    if not urls:
+        logger.warning(f"No {shop} URL(s) to tune on")
+        return
+
+    # Every profile has to load the pages itself
+    get_fetch_cache().ttl = 0
+
+    current = (client.wait_until, client.browser_type)
+    logger.info(f"Tuning {shop} on {len(urls)} URL(s), current profile {current}")
+    expected, _ = await run_profile(client, urls, *current)
+    expected = {url: df for url, df in expected.items() if df is not None}
+    if not expected:
+        logger.error(f"{shop} transform produced nothing under its current profile, keeping it")
+        return
+
+    results = []
+    for engine in ENGINES:
+        for wait_until in WAIT_UNTIL_MODES:
+            frames, timings = await run_profile(client, urls, wait_until, engine)
+            correct = all(frames_match(frames.get(url), df) for url, df in expected.items())
+            median = statistics.median(timings) if timings else float("inf")
+            results.append((wait_until, engine, correct, median, len(timings)))
+
+    print(f"\n{shop}")
+    for wait_until, engine, correct, median, n_loaded in results:
+        marker = "*" if (wait_until, engine) == current else " "
+        print(f"{marker} {wait_until:<17} {engine:<9} {n_loaded:>3}/{len(urls)} pages "
+              f"{median:7.2f}s median  {'identical' if correct else 'DIFFERENT'}")
+
+    candidates = [result for result in results if result[2]]
+    if not candidates:
+        logger.error(f"No {shop} profile matched the current output, keeping {current}")
+        return
+
+    wait_until, engine, _, median, _ = min(candidates, key=lambda result: result[3])
+    print(f"Fastest identical profile: wait_until={wait_until}, browser={engine} ({median:.2f}s/page)")
+    if not dry_run:
+        client.save_navigation_profile(wait_until, engine)
+
+
+async def main(shops, limit, dry_run):
+    for shop in shops:
+        await tune(shop, limit, dry_run)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Find the fastest wait_until and browser engine per shop that leaves transform output unchanged.")
+    parser.add_argument("shops", nargs="+",
+                        help="Shop names as registered in src.factory.SHOPS, or 'all'")
+    parser.add_argument("--limit", type=int, default=10,
+                        help="Number of unscraped product URLs to sample")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report the profiles without saving the fastest one")
+    args = parser.parse_args()
+
+    shops = list(SHOPS) if args.shops == ["all"] else args.shops
+    asyncio.run(main(shops, args.limit, args.dry_run))
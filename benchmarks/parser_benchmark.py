@@ -0,0 +1,131 @@
+import sys
+import time
+import asyncio
+import argparse
+import tracemalloc
+from pathlib import Path
+
+# Allow importing from the src directory
+sys.path.append(str(Path(__file__).parent.parent))
+
+from loguru import logger
+from src.factory import run_etl
+from src.etl import frames_match
+from src.scraper import scrape_url, AsyncWebScraper
+from src.fetch_cache import get_fetch_cache
+from src.html_parser import make_soup, container_strainer, is_parser_available
+
+PARSERS = ["html.parser", "lxml", "html5lib"]
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+
+def get_sample_urls(client, limit):
+    sql = client.connection.get_sql_from_file('select_unscraped_urls.sql')
+    sql = sql.format(shop=client.SHOP, table_name="urls")
+    return client.connection.extract_from_sql(sql)["url"].head(limit).tolist()
+
+
+async def fetch_pages(client, urls):
+    """Render each page once and return its raw HTML, read back from the fetch cache"""
+    cache = get_fetch_cache()
+    pages = []
+
+    async with AsyncWebScraper() as scraper:
+        scraper.empty_listing_texts = ()
+        for url in urls:
+            soup = await scrape_url(
+                url,
+                client.SELECTOR_SCRAPE_PRODUCT_INFO,
+                client.with_proxy,
+                wait_until=client.wait_until,
+                browser=client.browser_type,
+                scraper=scraper
+            )
+            if soup is None:
+                continue
+
+            cached = cache.get(url, selector=client.SELECTOR_SCRAPE_PRODUCT_INFO,
+                               wait_until=client.wait_until, browser=client.browser_type, headers=None)
+            pages.append((url, cached["html"] if cached else str(soup)))
+
+    return pages
+
+
+def measure(pages, parse, transform=None):
+    """Mean parse time and peak memory per page, and the transform output of each URL"""
+    parse_seconds = 0
+    peak_bytes = 0
+    frames = {}
+
+    for url, html in pages:
+        tracemalloc.start()
+        start = time.perf_counter()
+        soup = parse(html)
+        parse_seconds += time.perf_counter() - start
+        peak_bytes += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        if transform:
+            frames[url] = transform(soup, url)
+
+    n_pages = len(pages) or 1
+    return parse_seconds / n_pages * 1000, peak_bytes / n_pages / 1024 / 1024, frames
+
+
+def benchmark(shop, limit):
+    client = run_etl(shop)
+    urls = get_sample_urls(client, limit)
+    logger.info(f"Fetching {len(urls)} {shop} URL(s)")
+    pages = asyncio.run(fetch_pages(client, urls))
+    strainer = container_strainer(client.SELECTOR_SCRAPE_PRODUCT_INFO)
+
+    # Shops reading embedded data transform a StructuredPage rather than a soup
+    soup_transform = None if client.structured_data_blocks else client.transform
+
+    results = {}
+    if client.structured_data_blocks:
+        results["structured data"] = measure(
+            pages, client.parse_structured_data, client.transform)
+
+    for parser in PARSERS:
+        if not is_parser_available(parser):
+            continue
+
+        results[parser] = measure(
+            pages, lambda html: make_soup(html, parser=parser), soup_transform)
+        if strainer is not None:
+            results[f"{parser} + container"] = measure(
+                pages, lambda html: make_soup(html, strainer, parser), soup_transform)
+
+    if HTMLParser is not None:
+        # selectolax has its own API, so only its raw parse cost is comparable
+        results["selectolax (parse only)"] = measure(pages, HTMLParser)
+
+    print(f"{shop}: {len(pages)} page(s), container selector "
+          f"{client.SELECTOR_SCRAPE_PRODUCT_INFO!r}")
+    # html.parser is the default backend, so another one is only safe if it transforms identically
+    baseline = results.get("html.parser", (None, None, {}))[2]
+    for label, (parse_ms, peak_mb, frames) in results.items():
+        transformed = ""
+        if label == "structured data" or (soup_transform and "parse only" not in label):
+            n_transformed = sum(df is not None for df in frames.values())
+            transformed = f"{n_transformed:>4}/{len(pages)} transformed"
+            if soup_transform and label != "html.parser":
+                identical = all(frames_match(frames.get(url), df) for url, df in baseline.items())
+                transformed += f"  {'identical' if identical else 'DIFFERENT'}"
+        print(f"{label:<26} {parse_ms:8.2f} ms/page {peak_mb:8.2f} MB/page {transformed}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare parse time, memory and transform parity of the HTML parser backends for a shop.")
+    parser.add_argument("shop", help="Shop name as registered in src.factory.SHOPS")
+    parser.add_argument("--limit", type=int, default=20,
+                        help="Number of unscraped product URLs to sample")
+    args = parser.parse_args()
+
+    benchmark(args.shop, args.limit)
@@ -0,0 +1,294 @@
+import os
+import time
+import asyncio
+import psutil
+import multiprocessing
+
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Set
+from dotenv import load_dotenv
+from loguru import logger
+from .rate_limiter import get_host
+
+load_dotenv()
+
+PLAYWRIGHT = "playwright"
+PATCHRIGHT = "patchright"
+MAX_BROWSERS = int(os.getenv("MAX_BROWSERS", 4))
+MAX_BROWSERS_PER_HOST = int(os.getenv("MAX_BROWSERS_PER_HOST", 2))
+
+
+@dataclass(eq=False)
+class ManagedBrowser:
+    """A launched browser (or persistent context) and the processes it started"""
+    browser: Any
+    engine: str
+    driver: str
+    host: str
+    pids: Set[int] = field(default_factory=set)
+    launched_at: float = field(default_factory=time.monotonic)
+
+    def processes(self) -> List[psutil.Process]:
+        """The browser's processes, including renderers started after launch"""
+        processes = []
+        for pid in self.pids:
+            try:
+                process = psutil.Process(pid)
+                processes.append(process)
+                processes.extend(process.children(recursive=True))
+            except psutil.NoSuchProcess:
+                continue
+        return processes
+
+    def rss(self) -> int:
+        """Resident memory of the browser's whole process tree, in bytes"""
+        return total_rss(self.processes())
+
+
+def total_rss(processes: List[psutil.Process]) -> int:
+    rss = 0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return rss
+
+
+class BrowserManager:
+    """Single owner of every Playwright/patchright driver and browser process of the worker.
+
+    Launches are capped at ``max_browsers`` live browsers overall and
+    ``max_per_host`` per shop host; callers beyond the cap wait for a release.
+    The processes each launch spawns are recorded, so any browser process
+    left under a driver by a crashed or forgotten browser is detected and
+    killed, and a driver is stopped once its last browser is released.
+    """
+
+    def __init__(self, max_browsers: int = MAX_BROWSERS, max_per_host: int = MAX_BROWSERS_PER_HOST):
+        self.max_browsers = max_browsers
+        self.max_per_host = max_per_host
+        self.drivers: Dict[str, Any] = {}
+        self.driver_pids: Dict[str, Set[int]] = {}
+        self.browsers: List[ManagedBrowser] = []
+        self.n_launched = 0
+        self.n_orphans_killed = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _children() -> Set[int]:
+        # Worker processes, e.g. the transform pool, are never drivers
+        workers = {process.pid for process in multiprocessing.active_children()}
+        return {child.pid for child in psutil.Process().children() if child.pid not in workers}
+
+    def _driver_children(self, driver: str) -> Set[int]:
+        children = set()
+        for pid in self.driver_pids.get(driver, ()):
+            try:
+                children.update(child.pid for child in psutil.Process(pid).children())
+            except psutil.NoSuchProcess:
+                continue
+        return children
+
+    async def _start_driver(self, driver: str):
+        if driver not in self.drivers:
+            if driver == PATCHRIGHT:
+                from patchright.async_api import async_playwright
+            else:
+                from playwright.async_api import async_playwright
+
+            before = self._children()
+            self.drivers[driver] = await async_playwright().start()
+            self.driver_pids[driver] = self._children() - before
+
+        return self.drivers[driver]
+
+    def _bind_loop(self) -> None:
+        """Start over on a new event loop, killing what an earlier ``asyncio.run`` left behind"""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        if self.browsers or self.drivers:
+            stale = [process for managed in self.browsers for process in managed.processes()]
+            for pids in self.driver_pids.values():
+                for pid in pids:
+                    try:
+                        process = psutil.Process(pid)
+                        stale.extend(process.children(recursive=True))
+                        stale.append(process)
+                    except psutil.NoSuchProcess:
+                        continue
+
+            n_killed = sum(self._kill(process) for process in stale)
+            self.n_orphans_killed += n_killed
+            logger.warning(
+                f"Killed {n_killed} browser process(es) left by a previous event loop")
+
+        self._loop = loop
+        self.browsers = []
+        self.drivers = {}
+        self.driver_pids = {}
+        self._slots = asyncio.Semaphore(self.max_browsers)
+        self._host_slots = {}
+        self._launch_lock = asyncio.Lock()
+
+    async def _acquire(self, host: str) -> None:
+        self._bind_loop()
+        host_slots = self._host_slots.setdefault(
+            host, asyncio.Semaphore(self.max_per_host))
+
+        if host_slots.locked() or self._slots.locked():
+            logger.info(
+                f"Browser cap reached ({len(self.browsers)} live), waiting to launch for {host}")
+
+        await host_slots.acquire()
+        try:
+            await self._slots.acquire()
+        except BaseException:
+            host_slots.release()
+            raise
+
+    def _release_slots(self, host: str) -> None:
+        self._slots.release()
+        self._host_slots[host].release()
+
+    async def launch(self, host: str, engine: str = "chromium", driver: str = PLAYWRIGHT,
+                     user_data_dir: Optional[str] = None, **options) -> ManagedBrowser:
+        """Launch a browser for the host, or a persistent context if ``user_data_dir`` is given"""
+        await self._acquire(host)
+        try:
+            async with self._launch_lock:
+                playwright = await self._start_driver(driver)
+                browser_type = getattr(playwright, engine)
+
+                # Launches are serialized, so a new child of the driver is this browser;
+                # renderers other browsers spawn meanwhile sit under their own root
+                before = self._driver_children(driver)
+                if user_data_dir:
+                    browser = await browser_type.launch_persistent_context(user_data_dir, **options)
+                else:
+                    browser = await browser_type.launch(**options)
+                pids = self._driver_children(driver) - before
+        except BaseException:
+            self._release_slots(host)
+            await self._stop_idle_drivers()
+            raise
+
+        managed = ManagedBrowser(browser, engine, driver, host, pids)
+        self.browsers.append(managed)
+        self.n_launched += 1
+        logger.info(
+            f"Launched {engine} for {host}: {len(self.browsers)} live browser(s)")
+        return managed
+
+    async def release(self, managed: ManagedBrowser) -> None:
+        """Close the browser, kill whatever it leaves behind and free its slot"""
+        if managed not in self.browsers:
+            return
+        self.browsers.remove(managed)
+
+        try:
+            await managed.browser.close()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+
+        for process in managed.processes():
+            self._kill(process)
+
+        self._release_slots(managed.host)
+        self.reap_orphans()
+        await self._stop_idle_drivers()
+
+    async def _stop_idle_drivers(self) -> None:
+        for driver in list(self.drivers):
+            if any(managed.driver == driver for managed in self.browsers):
+                continue
+
+            try:
+                await self.drivers.pop(driver).stop()
+            except Exception as e:
+                logger.error(f"Error stopping {driver}: {e}")
+            self.driver_pids.pop(driver, None)
+
+    def _kill(self, process: psutil.Process) -> bool:
+        try:
+            process.kill()
+            return True
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return False
+
+    def reap_orphans(self) -> int:
+        """Kill browser processes under a driver that no live browser owns"""
+        owned = set(pid for pids in self.driver_pids.values() for pid in pids)
+        for managed in self.browsers:
+            owned.update(process.pid for process in managed.processes())
+
+        n_killed = 0
+        for pids in list(self.driver_pids.values()):
+            for pid in pids:
+                try:
+                    children = psutil.Process(pid).children(recursive=True)
+                except psutil.NoSuchProcess:
+                    continue
+                for child in children:
+                    if child.pid not in owned and self._kill(child):
+                        n_killed += 1
+
+        if n_killed:
+            self.n_orphans_killed += n_killed
+            logger.warning(f"Killed {n_killed} orphaned browser process(es)")
+        return n_killed
+
+    def process_stats(self) -> Dict[str, int]:
+        """Live browsers, their processes (drivers included) and total RSS in bytes"""
+        processes = []
+        for pids in self.driver_pids.values():
+            for pid in pids:
+                try:
+                    processes.append(psutil.Process(pid))
+                except psutil.NoSuchProcess:
+                    continue
+        for managed in self.browsers:
+            processes.extend(managed.processes())
+
+        return {"browsers": len(self.browsers), "processes": len(processes), "rss": total_rss(processes)}
+
+    def summary(self) -> str:
+        stats = self.process_stats()
+        return (f"Browsers: {stats['browsers']} live, {stats['processes']} process(es) "
+                f"using {stats['rss'] / 1024 / 1024:.0f} MB, {self.n_launched} launched, "
+                f"{self.n_orphans_killed} orphan(s) killed")
+
+    async def shutdown(self) -> None:
+        for managed in list(self.browsers):
+            await self.release(managed)
+        await self._stop_idle_drivers()
+
+
+_browser_manager: Optional[BrowserManager] = None
+
+
+def get_browser_manager() -> BrowserManager:
+    global _browser_manager
+
+    if _browser_manager is None:
+        _browser_manager = BrowserManager()
+
+    return _browser_manager
+
+
+@asynccontextmanager
+async def browser_session(url: str, engine: str = "chromium", driver: str = PLAYWRIGHT,
+                          user_data_dir: Optional[str] = None, **options):
+    """Launch a managed browser for the URL's host and release it on exit, even on errors"""
+    manager = get_browser_manager()
+    managed = await manager.launch(get_host(url), engine, driver, user_data_dir, **options)
+    try:
+        yield managed.browser
+    finally:
+        await manager.release(managed)
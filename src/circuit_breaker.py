@@ -0,0 +1,167 @@
+import time
+import asyncio
+import threading
+
+from collections import deque
+from typing import Dict
+from loguru import logger
+from .rate_limiter import get_host
+
+FAILURE_WINDOW = 20
+MIN_ATTEMPTS = 10
+FAILURE_RATE_THRESHOLD = 0.6
+OPEN_COOLDOWN = 60
+MAX_OPEN_COOLDOWN = 15 * 60
+MAX_FAILED_PROBES = 3
+RETRY_BUDGET_RATIO = 0.2  # retries earned per page
+RETRY_BUDGET_MIN = 10
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+ABORTED = "aborted"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a shop is given up on for the rest of the run"""
+    pass
+
+
+class HostCircuitBreaker:
+    """Circuit breaker plus retry budget shared by every scrape of one host.
+
+    Once ``FAILURE_RATE_THRESHOLD`` of the last ``FAILURE_WINDOW`` attempts
+    failed the breaker opens and scrapes wait out a cooldown. A single probe
+    then decides whether the host is back; after ``MAX_FAILED_PROBES`` failed
+    probes the host is aborted for the run. Retries draw on a budget that
+    grows by ``RETRY_BUDGET_RATIO`` per page, so a failing host
+    cannot multiply its load by the retry count.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=FAILURE_WINDOW)
+        self.open_until = 0.0
+        self.cooldown = OPEN_COOLDOWN
+        self.failed_probes = 0
+        self.retry_tokens = float(RETRY_BUDGET_MIN)
+        self.n_requests = 0
+        self.n_attempts = 0
+        self.n_retries = 0
+        self.n_denied_retries = 0
+        self.n_trips = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Count a new page to scrape, earning a fraction of a retry"""
+        with self._lock:
+            self.n_requests += 1
+            self.retry_tokens = min(self.retry_tokens + RETRY_BUDGET_RATIO,
+                                    RETRY_BUDGET_MIN + FAILURE_WINDOW)
+
+    async def before_attempt(self) -> None:
+        """Wait while the circuit is open, becoming the probe once the cooldown has passed"""
+        while True:
+            with self._lock:
+                if self.state == ABORTED:
+                    raise CircuitOpenError(
+                        f"{self.host} aborted after {self.n_trips} trip(s)")
+
+                if self.state == CLOSED:
+                    break
+
+                if self.state == OPEN and time.monotonic() >= self.open_until:
+                    self.state = HALF_OPEN
+                    logger.info(f"Circuit for {self.host} half-open, probing with one request")
+                    break
+
+                delay = max(0.5, self.open_until - time.monotonic()) \
+                    if self.state == OPEN else 0.5
+
+            await asyncio.sleep(min(delay, 5))
+
+        with self._lock:
+            self.n_attempts += 1
+
+    def allow_retry(self) -> bool:
+        """Spend one retry from the budget, if any is left"""
+        with self._lock:
+            if self.state == ABORTED:
+                return False
+
+            if self.retry_tokens < 1:
+                self.n_denied_retries += 1
+                if self.n_denied_retries == 1:
+                    logger.warning(
+                        f"Retry budget for {self.host} exhausted, failing pages without retrying")
+                return False
+
+            self.retry_tokens -= 1
+            self.n_retries += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = CLOSED
+                self.outcomes.clear()
+                self.cooldown = OPEN_COOLDOWN
+                self.failed_probes = 0
+                logger.success(f"Circuit for {self.host} closed, resuming")
+                return
+
+            if self.state == CLOSED:
+                self.outcomes.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.failed_probes += 1
+                if self.failed_probes >= MAX_FAILED_PROBES:
+                    self.state = ABORTED
+                    logger.error(
+                        f"Circuit for {self.host} aborted after {self.failed_probes} failed probe(s)")
+                    return
+
+                self.cooldown = min(self.cooldown * 2, MAX_OPEN_COOLDOWN)
+                self._open("probe failed")
+                return
+
+            if self.state != CLOSED:
+                return
+
+            self.outcomes.append(False)
+            n_failures = self.outcomes.count(False)
+            if len(self.outcomes) >= MIN_ATTEMPTS \
+                    and n_failures / len(self.outcomes) >= FAILURE_RATE_THRESHOLD:
+                self.n_trips += 1
+                self._open(f"{n_failures} of the last {len(self.outcomes)} attempts failed")
+
+    def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self.open_until = time.monotonic() + self.cooldown
+        logger.warning(
+            f"Circuit for {self.host} open for {self.cooldown}s: {reason}")
+
+    def summary(self) -> str:
+        return (f"Circuit for {self.host} {self.state}: {self.n_attempts} attempt(s) for {self.n_requests} page(s), "
+                f"{self.n_retries} retried, {self.n_denied_retries} retry(ies) denied by budget, "
+                f"{self.n_trips} trip(s)")
+
+
+_breakers: Dict[str, HostCircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(url: str) -> HostCircuitBreaker:
+    """Get the circuit breaker shared by every scrape of the URL's host"""
+    host = get_host(url)
+
+    with _registry_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = HostCircuitBreaker(host)
+            _breakers[host] = breaker
+
+    return breaker
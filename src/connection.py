@@ -1,4 +1,5 @@
 import os
+import hashlib
 import pandas as pd
 from pathlib import Path
 from sqlalchemy import create_engine, text, inspect, URL
@@ -34,6 +35,7 @@ class Connection:
             raise ValueError("db_type must be either 'mysql' or 'postgres'")
 
         self.engine = self._create_engine()
+        self.url_validators_ready = False
 
     def _create_engine(self) -> Engine:
         try:
@@ -85,6 +87,110 @@ class Connection:
             status=status, timestamp=timestamp, table_name=table, pkey=pkey)
         self.execute_query(formatted_sql)
 
+    def get_shop_state(self, shop: str, name: str, max_age_days: int = None):
+        """Get a persisted per-shop setting, ignoring it once older than max_age_days"""
+        self.execute_query(self.get_sql_from_file(
+            "create_table_shop_fetch_state.sql"))
+        sql = self.get_sql_from_file("select_shop_fetch_state.sql")
+        df = self.extract_from_sql(sql.format(shop=shop, name=name))
+
+        if df.empty:
+            return None
+
+        updated_date = pd.to_datetime(df.loc[0, "updated_date"])
+        if max_age_days is not None and updated_date < pd.Timestamp.now() - pd.Timedelta(days=max_age_days):
+            return None
+
+        return df.loc[0, "value"]
+
+    def set_shop_state(self, shop: str, name: str, value: str, timestamp: str) -> None:
+        sql = self.get_sql_from_file("upsert_shop_fetch_state.sql")
+        self.execute_query(sql.format(
+            shop=shop, name=name, value=value, timestamp=timestamp))
+
+    def get_url_validators(self, url: str):
+        """Get the ETag/Last-Modified validators stored for a URL, if any"""
+        self._ensure_url_validators_table()
+        sql = self.get_sql_from_file("select_url_validators.sql")
+        df = self.extract_from_sql(sql.format(url_hash=self.url_hash(url)))
+
+        if df.empty:
+            return None
+
+        return {
+            "etag": df.loc[0, "etag"],
+            "last_modified": df.loc[0, "last_modified"]
+        }
+
+    def set_url_validators(self, url: str, etag: str, last_modified: str, timestamp: str) -> None:
+        self._ensure_url_validators_table()
+        sql = self.get_sql_from_file("upsert_url_validators.sql")
+        self.execute_query(sql.format(
+            url_hash=self.url_hash(url),
+            url=url.replace("'", "''"),
+            etag=self._sql_literal(etag),
+            last_modified=self._sql_literal(last_modified),
+            timestamp=timestamp))
+
+    def get_url_content_hashes(self, shop: str) -> dict:
+        """Map url_hash -> content_hash of every page stored for the shop"""
+        self.execute_query(self.get_sql_from_file(
+            "create_table_url_content_hashes.sql"))
+        sql = self.get_sql_from_file("select_url_content_hashes.sql")
+        df = self.extract_from_sql(sql.format(shop=shop))
+        return dict(zip(df["url_hash"], df["content_hash"]))
+
+    def set_url_content_hash(self, shop: str, url: str, content_hash: str, timestamp: str) -> None:
+        sql = self.get_sql_from_file("upsert_url_content_hash.sql")
+        self.execute_query(sql.format(
+            url_hash=self.url_hash(url), shop=shop, url=url.replace("'", "''"),
+            content_hash=content_hash, timestamp=timestamp))
+
+    def mark_url_content_verified(self, url: str, timestamp: str) -> None:
+        sql = self.get_sql_from_file("update_url_content_verified.sql")
+        self.execute_query(sql.format(
+            url_hash=self.url_hash(url), timestamp=timestamp))
+
+    def get_product_ratings(self, source: str, max_age_days: int) -> dict:
+        """Map sku -> rating of every rating fetched from the source in the last max_age_days"""
+        self.execute_query(self.get_sql_from_file(
+            "create_table_product_ratings.sql"))
+        since = (pd.Timestamp.now() - pd.Timedelta(days=max_age_days)
+                 ).strftime("%Y-%m-%d %H:%M:%S")
+        sql = self.get_sql_from_file("select_product_ratings.sql")
+        df = self.extract_from_sql(sql.format(
+            source=source.replace("'", "''"), since=since))
+        return {sku: None if pd.isna(rating) else float(rating)
+                for sku, rating in zip(df["sku"], df["rating"])}
+
+    def set_product_ratings(self, source: str, ratings: dict, timestamp: str) -> None:
+        """Upsert a batch of sku -> rating (None when the product has no reviews)"""
+        if not ratings:
+            return
+
+        values = ",\n".join(
+            f"({self._sql_literal(source)}, '{self.url_hash(sku)}', {self._sql_literal(sku)}, "
+            f"{self._sql_literal(rating)}, '{timestamp}')"
+            for sku, rating in ratings.items())
+        sql = self.get_sql_from_file("upsert_product_ratings.sql")
+        self.execute_query(sql.format(values=values))
+
+    def _ensure_url_validators_table(self) -> None:
+        if not self.url_validators_ready:
+            self.execute_query(self.get_sql_from_file(
+                "create_table_url_validators.sql"))
+            self.url_validators_ready = True
+
+    @staticmethod
+    def url_hash(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _sql_literal(value) -> str:
+        if value is None or pd.isna(value):
+            return "NULL"
+        return "'" + str(value).replace("'", "''") + "'"
+
     def extract_from_sql(self, sql: str) -> pd.DataFrame:
         try:
             return pd.read_sql(sql, self.engine)
@@ -1,17 +1,84 @@
 import os
 import json
 import asyncio
+import hashlib
+import requests
 import pandas as pd
 
 from abc import ABC, abstractmethod
 from sqlalchemy.engine import Engine
 from .connection import Connection
-from .scraper import scrape_url
-from .proxy import ProxyRotator
+from .scraper import scrape_url, capture_url, evaluate_url, AsyncWebScraper, SCOPE_KEEP_SELECTORS, UNAVAILABLE_MARKERS
+from .http_client import fetch_html, conditional_get, remember_validators, has_validators, is_bot_wall
+from .rate_limiter import get_limiter
+from .html_parser import container_strainer, make_soup
+from .structured_data import StructuredPage
+from .resource_policy import DEFAULT_POLICY
+from .ratings import get_ratings_service
+from .circuit_breaker import get_breaker, CircuitOpenError
+from .browser_manager import get_browser_manager
+from .latency import get_latency
+from .transform_pool import run_transform, get_transform_pool
+from .proxy import ProxyRotator, get_connection_policy
 from loguru import logger
 from datetime import datetime as dt
 from bs4 import BeautifulSoup
 
+FETCH_TIER_HTTP = "http"
+FETCH_TIER_BROWSER = "browser"
+FETCH_TIER_TTL_DAYS = 30
+LATENCY_TTL_DAYS = 14
+NAVIGATION_PROFILE_TTL_DAYS = 30
+CONNECTION_MODE_TTL_DAYS = 7
+HTTP_TIER_PROBES = 5
+HTTP_TIER_MIN_HIT_RATE = 0.8
+EXTRACTION_PARITY_SAMPLES = 5
+PRODUCT_COLUMNS = ["shop", "name", "rating", "description", "url"]
+VARIANT_COLUMNS = ["variant", "price", "discounted_price",
+                   "discount_percentage", "image_urls"]
+
+# Errors are returned rather than thrown so that they fail the product like
+# a transform error instead of retrying the navigation
+EXTRACTION_SCRIPT_WRAPPER = """
+() => {{
+    try {{
+        return ({script})();
+    }} catch (e) {{
+        return {{error: String(e)}};
+    }}
+}}
+"""
+
+
+def get_extraction_script(file_name: str) -> str:
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             'extraction_scripts', file_name)
+    with open(file_path, 'r') as f:
+        return EXTRACTION_SCRIPT_WRAPPER.format(script=f.read().strip().rstrip(';'))
+
+
+def frames_match(actual: pd.DataFrame, expected: pd.DataFrame) -> bool:
+    """Compare two product frames cell by cell, treating numbers by value and missing values alike"""
+    if actual is None or expected is None:
+        return actual is None and expected is None
+
+    if list(actual.columns) != list(expected.columns) or actual.shape != expected.shape:
+        return False
+
+    for a, b in zip(actual.itertuples(index=False), expected.itertuples(index=False)):
+        for x, y in zip(a, b):
+            if pd.isna(x) and pd.isna(y):
+                continue
+            try:
+                if abs(float(x) - float(y)) < 1e-6:
+                    continue
+            except (TypeError, ValueError):
+                pass
+            if str(x).strip() != str(y).strip():
+                return False
+
+    return True
+
 
 class PetProductsETL(ABC):
     def __init__(self):
@@ -23,12 +90,421 @@ class PetProductsETL(ABC):
         self.connection = Connection()
         self.wait_until = "load"
         self.browser_type = 'chromium'
-        self.with_proxy = False
-
-    async def scrape(self, url, selector, proxy=None, headers=None, wait_until="load", min_sec=1, max_sec=3, browser='firefox'):
-        soup = await scrape_url(url, selector, proxy, headers, wait_until, min_sec=min_sec, max_sec=max_sec, browser=browser)
+        # None learns per shop whether direct connections are blocked; True/False force proxies on/off
+        self.with_proxy = None
+        self.concurrency = 3
+        self.scraper = None
+        self.fetch_tier = None
+        self.http_attempts = 0
+        self.http_hits = 0
+        self.revalidate = True
+        self.validator_hits = 0
+        self.validator_misses = 0
+        self.content_hashes = {}
+        self.partial_parse = False
+        # Shops opt in to another backend, e.g. lxml, once parser_benchmark shows identical output
+        self.html_parser = None
+        self.scoped_content = False
+        self.extraction_script = None
+        self.extraction_script_ok = True
+        self.extraction_parity_checks = 0
+        self.offload_transform = False
+        self.unavailable_markers = ()
+        self.navigation_profile = None
+        self.structured_data_blocks = None
+        self.resource_policy = DEFAULT_POLICY
+
+    async def scrape(self, url, selector, proxy=None, headers=None, wait_until="load", min_sec=1, max_sec=3, browser='firefox', parse_only=None, parse=None, keep_selectors=None):
+        wait_until, browser = self.get_navigation(wait_until, browser)
+        soup = await scrape_url(url, selector, proxy, headers, wait_until, min_sec=min_sec, max_sec=max_sec, browser=browser, scraper=self.scraper, parse_only=parse_only, parse=parse, keep_selectors=keep_selectors)
         return soup if soup else False
 
+    async def evaluate(self, url, selector, script, proxy=None, headers=None, wait_until="load", min_sec=1, max_sec=3, browser='firefox', with_html=False):
+        """What ``script`` evaluates to in the loaded page, optionally with the page HTML"""
+        wait_until, browser = self.get_navigation(wait_until, browser)
+        return await evaluate_url(url, selector, script, proxy, headers, wait_until, min_sec=min_sec, max_sec=max_sec, browser=browser, scraper=self.scraper, with_html=with_html)
+
+    async def capture(self, url, patterns, proxy=None, selector=None, headers=None, wait_until="load", min_sec=1, max_sec=3, browser='firefox', min_responses=1):
+        """JSON payloads of the API calls matching ``patterns`` made while loading the URL"""
+        return await capture_url(url, patterns, proxy, selector, headers, wait_until, min_sec=min_sec, max_sec=max_sec, browser=browser, scraper=self.scraper, min_responses=min_responses)
+
+    def uses_http_tier(self, url):
+        """Whether the product page is first fetched with plain HTTP before the browser"""
+        return bool(self.SELECTOR_SCRAPE_PRODUCT_INFO) and self.fetch_tier != FETCH_TIER_BROWSER \
+            and self.allows_direct_http(url, self.with_proxy)
+
+    def allows_direct_http(self, url, proxy):
+        """Whether plain HTTP requests, which always leave from our own IP, may be sent to the URL.
+
+        Not when the load must go through a proxy, whether forced with
+        ``proxy=True`` or learned by the host's connection policy.
+        """
+        if proxy is None:
+            return not get_connection_policy(url).needs_proxy()
+        return not proxy
+
+    async def scrape_http(self, url, selector, headers=None, min_sec=1, max_sec=3, parse_only=None, parse=None):
+        get_limiter(url, min_sec, max_sec)
+        return await fetch_html(url, selector, headers, parse_only, parse)
+
+    def record_http_attempt(self, hit: bool):
+        self.http_attempts += 1
+        if hit:
+            self.http_hits += 1
+            return
+
+        # Stop paying for HTTP misses once the shop clearly needs a browser
+        if self.fetch_tier is None and self.http_attempts >= HTTP_TIER_PROBES \
+                and self.http_hits / self.http_attempts < HTTP_TIER_MIN_HIT_RATE:
+            logger.warning(
+                f"{self.SHOP} pages need a browser, skipping the HTTP tier for this run")
+            self.fetch_tier = FETCH_TIER_BROWSER
+
+    def load_fetch_tier(self):
+        self.fetch_tier = self.connection.get_shop_state(
+            self.SHOP, "fetch_tier", max_age_days=FETCH_TIER_TTL_DAYS)
+        self.http_attempts = 0
+        self.http_hits = 0
+        logger.info(f"{self.SHOP} fetch tier: {self.fetch_tier or 'unknown'}")
+
+    def save_fetch_tier(self):
+        if self.http_attempts == 0:
+            return
+
+        if self.http_hits / self.http_attempts >= HTTP_TIER_MIN_HIT_RATE:
+            tier = FETCH_TIER_HTTP
+        else:
+            tier = FETCH_TIER_BROWSER
+
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.connection.set_shop_state(self.SHOP, "fetch_tier", tier, now)
+        logger.info(
+            f"{self.SHOP} fetch tier saved as {tier} ({self.http_hits}/{self.http_attempts} pages over HTTP)")
+
+    def get_navigation(self, wait_until, browser):
+        """The tuned ``wait_until`` and engine, for loads made with the shop's own defaults.
+
+        Loads asking for another wait or engine explicitly, e.g. category
+        pages waiting for ``networkidle``, are left as they are.
+        """
+        if self.navigation_profile and (wait_until, browser) == (self.wait_until, self.browser_type):
+            return self.navigation_profile
+        return wait_until, browser
+
+    def load_navigation_profile(self):
+        state = self.connection.get_shop_state(
+            self.SHOP, "navigation_profile", max_age_days=NAVIGATION_PROFILE_TTL_DAYS)
+        self.navigation_profile = tuple(state.split("|")) if state else None
+        if self.navigation_profile:
+            logger.info(
+                f"{self.SHOP} navigation profile: wait_until={self.navigation_profile[0]}, browser={self.navigation_profile[1]}")
+
+    def save_navigation_profile(self, wait_until, browser):
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.connection.set_shop_state(
+            self.SHOP, "navigation_profile", f"{wait_until}|{browser}", now)
+        self.navigation_profile = (wait_until, browser)
+
+    def load_connection_mode(self):
+        """Start proxied if recent runs found the shop blocking direct connections"""
+        mode = self.connection.get_shop_state(
+            self.SHOP, "connection_mode", max_age_days=CONNECTION_MODE_TTL_DAYS)
+        get_connection_policy(self.BASE_URL).load(mode)
+
+    def save_connection_mode(self):
+        policy = get_connection_policy(self.BASE_URL)
+        # Without direct attempts this run, let a saved proxied mode expire so direct gets probed again
+        if self.with_proxy is not None or not policy.outcomes:
+            return
+
+        logger.info(f"{self.SHOP} connection mode: {policy.mode}")
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.connection.set_shop_state(self.SHOP, "connection_mode", policy.mode, now)
+
+    def load_latency(self):
+        """Start the run with the timeouts learned from the shop's recent runs"""
+        state = self.connection.get_shop_state(
+            self.SHOP, "latency", max_age_days=LATENCY_TTL_DAYS)
+        get_latency(self.BASE_URL).load(state)
+
+    def save_latency(self):
+        latency = get_latency(self.BASE_URL)
+        logger.info(latency.summary())
+
+        state = latency.dump()
+        if state:
+            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.connection.set_shop_state(self.SHOP, "latency", state, now)
+
+    def get_revalidation_request(self, url):
+        """URL and headers whose ETag/Last-Modified tell whether a product changed.
+
+        Pages fetched over HTTP are revalidated themselves; shops with a JSON
+        endpoint behind the page override this. Return None to always scrape.
+        """
+        if self.fetch_tier == FETCH_TIER_HTTP:
+            return url, None
+        return None
+
+    async def check_unchanged(self, url):
+        """Send a conditional GET for the product.
+
+        Returns whether the host answered 304, plus the (url, response) whose
+        validators should be stored once the product is loaded successfully.
+        """
+        request = self.get_revalidation_request(url) \
+            if self.revalidate and self.allows_direct_http(url, self.with_proxy) else None
+        if request is None:
+            return False, None
+
+        check_url, headers = request
+        try:
+            response = await asyncio.to_thread(conditional_get, check_url, headers, need_body=False)
+        except requests.RequestException as e:
+            logger.warning(f"Conditional GET failed for {check_url}: {e}")
+            return False, None
+
+        if response.not_modified:
+            return True, None
+
+        if response.status_code != 200 or is_bot_wall(response):
+            return False, None
+
+        if has_validators(response):
+            self.validator_hits += 1
+            return False, (check_url, response)
+
+        # Stop revalidating once the shop clearly sends no validators
+        self.validator_misses += 1
+        if self.validator_hits == 0 and self.validator_misses >= HTTP_TIER_PROBES:
+            logger.warning(
+                f"{self.SHOP} sends no ETag/Last-Modified, skipping conditional GETs for this run")
+            self.revalidate = False
+
+        return False, None
+
+    def get_parse_only(self):
+        """Strainer limiting product page parsing to the product container, if the shop opted in"""
+        if not self.partial_parse:
+            return None
+
+        return container_strainer(self.SELECTOR_SCRAPE_PRODUCT_INFO)
+
+    def get_keep_selectors(self):
+        """Nodes the browser returns besides the product container, if the shop opted in to scoped content.
+
+        Defaults to meta tags and JSON-LD blocks, the same nodes partial parsing keeps.
+        """
+        if not self.scoped_content or not self.SELECTOR_SCRAPE_PRODUCT_INFO:
+            return None
+
+        return SCOPE_KEEP_SELECTORS
+
+    def get_parse(self):
+        """How product pages are read: the shop's structured data, its HTML backend, or None for the default soup"""
+        if self.structured_data_blocks:
+            return self.parse_structured_data
+        if self.html_parser:
+            return self.parse_html
+        return None
+
+    def parse_html(self, html: str) -> BeautifulSoup:
+        return make_soup(html, self.get_parse_only(), self.html_parser)
+
+    def parse_structured_data(self, html: str) -> StructuredPage:
+        """Read the shop's embedded data blocks straight from the raw HTML, without a DOM"""
+        return StructuredPage(html, self.structured_data_blocks)
+
+    def get_content_fingerprint(self, soup: BeautifulSoup):
+        """Hash of the parts of a product page that transform reads.
+
+        Defaults to the JSON-LD blocks plus the product container, so layout
+        noise outside the container does not count as a change.
+        """
+        if isinstance(soup, StructuredPage):
+            return soup.fingerprint()
+
+        blocks = [script.get_text() for script in soup.select(
+            "script[type*='application/ld+json']")]
+        container = soup.select_one(
+            self.SELECTOR_SCRAPE_PRODUCT_INFO) if self.SELECTOR_SCRAPE_PRODUCT_INFO else None
+        blocks.append(str(container) if container else str(soup))
+
+        return hashlib.sha256("\n".join(blocks).encode("utf-8")).hexdigest()
+
+    def uses_extraction_script(self):
+        """Whether product pages are read by the shop's in-browser extraction script.
+
+        Shops the HTTP tier serves keep using transform, and so does the rest
+        of the run once the script disagreed with transform.
+        """
+        return bool(self.extraction_script) and self.extraction_script_ok \
+            and self.fetch_tier != FETCH_TIER_HTTP
+
+    def records_to_frame(self, record, url: str):
+        """Build the transform output from the product record returned by an extraction script.
+
+        The record holds name, rating, description and a list of variants with
+        the variant columns. A null record skips the product like a transform
+        returning None, while a record without variants gives an empty frame
+        with the usual columns, so it loads nothing.
+        """
+        if record is None:
+            return None
+
+        df = pd.DataFrame(record.get("variants") or [], columns=VARIANT_COLUMNS)
+        df.insert(0, "url", url.replace(self.BASE_URL, ""))
+        df.insert(0, "description", record.get("description"))
+        df.insert(0, "rating", record.get("rating"))
+        df.insert(0, "name", record.get("name"))
+        df.insert(0, "shop", self.SHOP)
+        return df
+
+    async def evaluate_product(self, url):
+        """Product frame and content hash read in the page by the extraction script.
+
+        The first EXTRACTION_PARITY_SAMPLES pages of a run also bring back their
+        HTML and are checked against transform; on a mismatch transform's frame
+        is used and the script is switched off for the rest of the run.
+        """
+        check_parity = self.extraction_parity_checks < EXTRACTION_PARITY_SAMPLES
+        page = await self.evaluate(
+            url,
+            self.SELECTOR_SCRAPE_PRODUCT_INFO,
+            get_extraction_script(self.extraction_script),
+            proxy=self.with_proxy,
+            min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+            max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
+            wait_until=self.wait_until,
+            browser=self.browser_type,
+            with_html=check_parity
+        )
+        if page is None:
+            return None, None
+
+        if isinstance(page.data, dict) and "error" in page.data:
+            logger.error(f"Error scraping {url}: {page.data['error']}")
+            return None, None
+
+        df = self.records_to_frame(page.data, url)
+        content_hash = hashlib.sha256(json.dumps(
+            page.data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+        if check_parity and page.html is not None:
+            self.extraction_parity_checks += 1
+            expected = await self.transform_async(make_soup(page.html, parser=self.html_parser), url)
+            if not frames_match(df, expected):
+                logger.warning(
+                    f"{self.SHOP} extraction script disagrees with transform on {url}, using transform for the rest of the run")
+                self.extraction_script_ok = False
+                return expected, None
+
+            logger.info(
+                f"{self.SHOP} extraction script matches transform on {url}")
+
+        return df, content_hash
+
+    def uses_transform_pool(self):
+        """Whether product pages are parsed and transformed in the process pool.
+
+        Shops opt in with ``offload_transform`` once their pooled output has
+        been checked on a real run. Only shops whose transform is a pure
+        function of the page qualify: those overriding ``transform_async``
+        await side calls on the event loop.
+        """
+        return self.offload_transform and get_transform_pool() is not None \
+            and type(self).transform_async is PetProductsETL.transform_async
+
+    async def transform_product(self, url):
+        """Scrape the product page and transform it, trying plain HTTP before the browser.
+
+        Returns the frame and the page's content fingerprint. The frame is None
+        when transform found nothing, or when the fingerprint matches the last
+        run's and transform was skipped. A page fetched over HTTP only counts
+        as a hit of the HTTP tier once it transforms (or is known content);
+        otherwise, e.g. when a generic container is served but the prices are
+        rendered by JS, the page is loaded again in the browser.
+        """
+        known_hash = self.content_hashes.get(self.connection.url_hash(url))
+        parse_only = self.get_parse_only()
+        parse = self.get_parse()
+
+        if self.uses_http_tier(url):
+            soup = await self.scrape_http(url, self.SELECTOR_SCRAPE_PRODUCT_INFO,
+                                          min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+                                          max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
+                                          parse_only=parse_only, parse=parse)
+            if soup:
+                content_hash = self.get_content_fingerprint(soup)
+                if content_hash and content_hash == known_hash:
+                    self.record_http_attempt(True)
+                    return None, content_hash
+
+                df = await self.transform_async(soup, url)
+                self.record_http_attempt(df is not None)
+                if df is not None:
+                    return df, content_hash
+                logger.info(f"No product in the raw HTML of {url}, using the browser")
+            else:
+                self.record_http_attempt(False)
+
+        soup = await self.scrape(
+            url,
+            self.SELECTOR_SCRAPE_PRODUCT_INFO,
+            proxy=self.with_proxy,
+            min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+            max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
+            wait_until=self.wait_until,
+            browser=self.browser_type,
+            parse_only=parse_only,
+            parse=parse,
+            keep_selectors=self.get_keep_selectors()
+        )
+        if not soup:
+            return None, None
+
+        content_hash = self.get_content_fingerprint(soup)
+        if content_hash and content_hash == known_hash:
+            return None, content_hash
+
+        return await self.transform_async(soup, url), content_hash
+
+    async def transform_in_pool(self, url):
+        """Fetch the raw product page and have a pool worker parse, fingerprint and transform it.
+
+        Follows the same HTTP-first tiering as ``transform_product``.
+        """
+        known_hash = self.content_hashes.get(self.connection.url_hash(url))
+
+        if self.uses_http_tier(url):
+            html = await self.scrape_http(url, self.SELECTOR_SCRAPE_PRODUCT_INFO,
+                                          min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+                                          max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO, parse=str)
+            result = await run_transform(self, html, url, known_hash, require_selector=True) if html else None
+            hit = result is not None and result.found and (
+                result.records is not None or (known_hash is not None and result.content_hash == known_hash))
+            self.record_http_attempt(hit)
+            if hit:
+                return result
+            if result is not None:
+                logger.info(f"No product in the raw HTML of {url}, using the browser")
+
+        html = await self.scrape(
+            url,
+            self.SELECTOR_SCRAPE_PRODUCT_INFO,
+            proxy=self.with_proxy,
+            min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+            max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
+            wait_until=self.wait_until,
+            browser=self.browser_type,
+            parse=str,
+            keep_selectors=self.get_keep_selectors()
+        )
+        if not html:
+            return None
+
+        return await run_transform(self, html, url, known_hash)
+
     @abstractmethod
     def extract(self, category):
         pass
@@ -37,6 +513,15 @@ class PetProductsETL(ABC):
     def transform(self, soup: BeautifulSoup, url: str):
         pass
 
+    async def transform_async(self, soup: BeautifulSoup, url: str):
+        """Transform a product page inside the event loop.
+
+        Shops whose transform makes HTTP side calls override this and await
+        them with ``http_get_async``, so the calls of concurrent pages overlap
+        instead of stalling every worker. Others run ``transform`` as is.
+        """
+        return self.transform(soup, url)
+
     def load(self, data: pd.DataFrame, table_name: str):
         try:
             n = data.shape[0]
@@ -76,39 +561,113 @@ class PetProductsETL(ABC):
 
         self._temp_table(f"DROP TABLE {temp_table};", temp_table, 'deleted')
 
+    async def scrape_product_info(self, pkey, url, temp_table):
+        now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+        unchanged, validated = await self.check_unchanged(url)
+
+        if unchanged:
+            self.connection.mark_url_content_verified(url, now)
+            self.connection.update_url_scrape_status(
+                pkey, "UNCHANGED", 'urls', now)
+            return
+
+        scripted = self.uses_extraction_script()
+        pooled = not scripted and self.uses_transform_pool()
+        if scripted:
+            df, content_hash = await self.evaluate_product(url)
+        elif pooled:
+            result = await self.transform_in_pool(url)
+            df = result.to_frame() if result else None
+            content_hash = result.content_hash if result else None
+        else:
+            df, content_hash = await self.transform_product(url)
+
+        skipped = self.scraper.skipped.pop(url, None) if self.scraper else None
+        if skipped:
+            # Kept out of the product tables and queued after the other URLs next run
+            self.connection.update_url_scrape_status(
+                pkey, "UNAVAILABLE", 'urls', now)
+            return
+
+        if content_hash and self.content_hashes.get(self.connection.url_hash(url)) == content_hash:
+            logger.info(f"Content unchanged since last run: {url}")
+            self.connection.mark_url_content_verified(url, now)
+            self.connection.update_url_scrape_status(
+                pkey, "UNCHANGED", 'urls', now)
+            if validated:
+                remember_validators(*validated)
+            return
+
+        if df is not None:
+            self.load(df, temp_table)
+            self.connection.update_url_scrape_status(
+                pkey, "DONE", 'urls', now)
+            if content_hash:
+                self.connection.set_url_content_hash(
+                    self.SHOP, url, content_hash, now)
+            if validated:
+                remember_validators(*validated)
+        else:
+            self.connection.update_url_scrape_status(
+                pkey, "FAILED", 'urls', now)
+
     async def get_product_infos(self):
         temp_table = f"stg_{self.SHOP.lower()}_temp_products"
         df_urls = self.extract_unscraped_data(temp_table)
 
-        loop = asyncio.get_event_loop()
-
-        for i, row in df_urls.iterrows():
-            pkey = row["id"]
-            url = row["url"]
-
-            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            soup = await self.scrape(
-                url,
-                self.SELECTOR_SCRAPE_PRODUCT_INFO,
-                proxy=self.with_proxy,
-                min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
-                max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
-                wait_until=self.wait_until,
-                browser=self.browser_type
-            )
-
-            df = self.transform(soup, url)
-
-            if df is not None:
-                self.load(df, temp_table)
-                self.connection.update_url_scrape_status(
-                    pkey, "DONE", 'urls', now)
-            else:
-                self.connection.update_url_scrape_status(
-                    pkey, "FAILED", 'urls', now)
-
-            logger.info(f"{i+1} out of {len(df_urls)} URL(s) Scraped")
-
+        self.load_fetch_tier()
+        self.load_navigation_profile()
+        self.load_connection_mode()
+        self.load_latency()
+        self.revalidate = True
+        self.validator_hits = 0
+        self.validator_misses = 0
+        self.content_hashes = self.connection.get_url_content_hashes(self.SHOP)
+        self.extraction_script_ok = True
+        self.extraction_parity_checks = 0
+        rows = iter(df_urls[["id", "url"]].itertuples(index=False))
+        n_scraped = 0
+
+        async def worker():
+            nonlocal n_scraped
+            # Workers share the row iterator, so each URL is scraped exactly once
+            for pkey, url in rows:
+                try:
+                    await self.scrape_product_info(pkey, url, temp_table)
+                except CircuitOpenError as e:
+                    # Left unscraped, so the next run picks the URL up again
+                    logger.error(f"Stopping {self.SHOP} worker: {e}")
+                    return
+                except Exception as e:
+                    # One broken page must not take the other workers and the staged rows with it
+                    logger.error(f"Failed to scrape {url}: {e}")
+                    self.connection.update_url_scrape_status(
+                        pkey, "FAILED", 'urls', dt.now().strftime("%Y-%m-%d %H:%M:%S"))
+                n_scraped += 1
+                logger.info(f"{n_scraped} out of {len(df_urls)} URL(s) Scraped")
+
+        # One browser is kept alive for the whole run and recycled by the scraper,
+        # with up to `concurrency` tabs paced together by the shop's rate limiter
+        async with AsyncWebScraper() as scraper:
+            scraper.use_resource_policy(self.resource_policy, self.BASE_URL)
+            scraper.unavailable_markers = UNAVAILABLE_MARKERS + tuple(self.unavailable_markers)
+            scraper.empty_listing_texts = ()
+            self.scraper = scraper
+            try:
+                await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+            finally:
+                self.scraper = None
+
+        logger.info(self.resource_policy.summary())
+        logger.info(get_breaker(self.BASE_URL).summary())
+        logger.info(get_browser_manager().summary())
+        ratings = get_ratings_service()
+        if ratings.n_cached or ratings.n_requests:
+            logger.info(ratings.summary())
+
+        self.save_fetch_tier()
+        self.save_latency()
+        self.save_connection_mode()
         self.insert_scrape_in_database(temp_table)
 
     def get_links_by_category(self):
@@ -153,7 +712,13 @@ class PetProductsETL(ABC):
             url = row["url"]
 
             now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
-            df = self.extract(url)
+            try:
+                df = self.extract(url)
+            except CircuitOpenError as e:
+                # The staging tables are kept, so the next run resumes from this category
+                logger.error(f"Stopping {self.SHOP} category scrape: {e}")
+                return
+
             if df is not None:
                 self.load(df, temp_table)
                 self.connection.update_url_scrape_status(
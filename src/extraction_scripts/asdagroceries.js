@@ -0,0 +1,54 @@
+() => {
+    if (!document.querySelector("main.product-detail-page")) {
+        return {variants: []};
+    }
+
+    const round2 = x => Math.round(x * 100) / 100;
+    const firstPrice = text => {
+        const match = text.match(/(\d+\.\d+)/);
+        return match ? parseFloat(match[1]) : null;
+    };
+
+    const name = document.querySelector("h1.pdp-main-details__title").textContent;
+    const descriptionWrapper = document.querySelector("div.pdp-description-reviews__product-details-cntr");
+    const description = descriptionWrapper ? descriptionWrapper.textContent : null;
+
+    const ratingWrapper = document.querySelector("div.pdp-main-details__rating");
+    const rating = ratingWrapper ? ratingWrapper.getAttribute("aria-label").split(" ")[0] + "/5" : "0/5";
+
+    // The headline price must be readable even though the regex price below is used
+    const priceStrong = document.querySelector("div.pdp-main-details__price-container")
+        .querySelector("strong.co-product__price, strong.pdp-main-details__price");
+    const ownText = Array.from(priceStrong.childNodes).find(node => node.nodeType === Node.TEXT_NODE);
+    const headline = ownText ? ownText.textContent.trim().replaceAll("£", "") : "";
+    if (headline === "" || isNaN(Number(headline))) {
+        throw new Error("could not convert headline price to float");
+    }
+
+    const weight = document.querySelector("div.pdp-main-details__weight");
+    const variant = weight ? weight.textContent : null;
+    const imageUrl = document.querySelector('meta[property="og:image"]').getAttribute("content");
+
+    const price = firstPrice(document.querySelector(
+        'strong[class="co-product__price pdp-main-details__price"]').textContent);
+    if (price === null) throw new Error("price not found");
+    const wasPrice = document.querySelector(
+        'span[class="co-product__was-price pdp-main-details__was-price"]');
+
+    if (wasPrice) {
+        const realPrice = firstPrice(wasPrice.textContent);
+        if (realPrice === null) throw new Error("was price not found");
+        return {
+            name, rating, description, variants: [{
+                variant, price: realPrice, discounted_price: price,
+                discount_percentage: round2((realPrice - price) / realPrice), image_urls: imageUrl
+            }]
+        };
+    }
+
+    return {
+        name, rating, description, variants: [{
+            variant, price, discounted_price: null, discount_percentage: null, image_urls: imageUrl
+        }]
+    };
+}
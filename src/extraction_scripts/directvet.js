@@ -0,0 +1,74 @@
+() => {
+    const strippedText = node => {
+        const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) {
+            const part = walker.currentNode.textContent.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join("");
+    };
+    const round2 = x => Math.round(x * 100) / 100;
+    const toPrice = text => parseFloat(text.replaceAll("£", ""));
+
+    const name = document.querySelector('h1[itemprop="name"]').textContent;
+    const descriptionDiv = document.querySelector("div#short_description_content");
+    const description = strippedText(descriptionDiv);
+
+    let rating = "0/5";
+    if (document.querySelector("div#product_comments_block_extra").querySelector("div.star_content")) {
+        const rates = Array.from(
+            document.querySelector("div#product_comments_block_tab").querySelectorAll('div[itemprop="reviewRating"]'),
+            review => parseInt(review.querySelector('meta[itemprop="ratingValue"]').getAttribute("content"), 10));
+        if (!rates.length) throw new Error("division by zero");
+        rating = `${round2(rates.reduce((a, b) => a + b, 0) / rates.length)}/5`;
+    }
+
+    const imageUrl = () => document.querySelector("img#bigpic").getAttribute("src");
+    const variants = [];
+    const matrix = document.querySelector("table#ct_matrix");
+
+    if (matrix) {
+        for (const row of matrix.querySelector("tbody").querySelectorAll("tr")) {
+            const label = row.querySelector('td[data-label="Select"]')
+                || row.querySelector('td[data-label="Color"]')
+                || row.querySelector('td[data-label="Size"]');
+            const priceCell = row.querySelector('td[data-label="Price"]');
+            const strike = priceCell.querySelector("strike");
+
+            if (strike) {
+                const formerPrice = toPrice(strike.textContent);
+                const currentPrice = toPrice(priceCell.querySelector("strong.strongprice").textContent);
+                variants.push({
+                    variant: label.textContent, price: currentPrice,
+                    discounted_price: formerPrice - currentPrice,
+                    discount_percentage: round2(((formerPrice - currentPrice) / formerPrice) * 100),
+                    image_urls: imageUrl()
+                });
+            } else {
+                variants.push({
+                    variant: label.textContent, price: toPrice(priceCell.textContent),
+                    discounted_price: null, discount_percentage: null, image_urls: imageUrl()
+                });
+            }
+        }
+    } else {
+        let variant = null;
+        const h2 = descriptionDiv.querySelector("h2");
+        const paragraphs = descriptionDiv.querySelectorAll("p");
+        const clean = text => text.replaceAll("- ", "").replaceAll("-", "").trim();
+
+        if (h2) {
+            variant = clean(strippedText(h2));
+        } else if (paragraphs.length) {
+            variant = clean(strippedText(paragraphs[paragraphs.length - 1]));
+        }
+
+        variants.push({
+            variant, price: toPrice(document.querySelector('span[itemprop="price"]').textContent),
+            discounted_price: null, discount_percentage: null, image_urls: imageUrl()
+        });
+    }
+
+    return {name, rating, description, variants};
+}
@@ -0,0 +1,63 @@
+() => {
+    const strippedText = node => {
+        const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        const parts = [];
+        while (walker.nextNode()) {
+            const part = walker.currentNode.textContent.trim();
+            if (part) parts.push(part);
+        }
+        return parts.join("");
+    };
+    const round2 = x => Math.round(x * 100) / 100;
+    const imageUrl = () => document.querySelector('meta[property="og:image"]').getAttribute("content");
+
+    const name = document.querySelector("div.page-header").querySelector("h1").textContent;
+    const reviews = document.querySelector("div#reviews");
+    const rating = reviews ? strippedText(reviews.querySelector("span.average_stars")) : "0/5";
+
+    const variants = [];
+    const options = document.querySelector("div.in_page_options_option");
+
+    if (options) {
+        for (const option of options.querySelectorAll("div.sub-options")) {
+            const variant = option.querySelector("div.inpage_option_title").textContent;
+            const currentPrice = parseFloat(
+                option.querySelector("div.ajax-price").textContent.replaceAll("£", ""));
+            const rrp = option.querySelector("span.inpage_option_rrp");
+
+            if (rrp) {
+                const price = parseFloat(rrp.textContent.replaceAll("RRP: £", ""));
+                variants.push({
+                    variant, price, discounted_price: currentPrice,
+                    discount_percentage: round2((price - currentPrice) / price),
+                    image_urls: imageUrl()
+                });
+            } else {
+                variants.push({
+                    variant, price: currentPrice, discounted_price: null,
+                    discount_percentage: null, image_urls: imageUrl()
+                });
+            }
+        }
+    } else {
+        const priceVat = document.querySelector("span.ajax-price-vat").textContent;
+        const rrp = document.querySelector("span.ajax-rrp").textContent;
+
+        if (priceVat.replaceAll("£", "") === rrp.replaceAll("£", "") || rrp === "£0.00") {
+            variants.push({
+                variant: null, price: parseFloat(priceVat.replaceAll("£", "")),
+                discounted_price: null, discount_percentage: null, image_urls: imageUrl()
+            });
+        } else {
+            const price = parseFloat(rrp.replaceAll("£", ""));
+            const discountPrice = parseFloat(priceVat.replaceAll("£", ""));
+            variants.push({
+                variant: null, price, discounted_price: discountPrice,
+                discount_percentage: round2((price - discountPrice) / price),
+                image_urls: imageUrl()
+            });
+        }
+    }
+
+    return {name, rating, description: null, variants};
+}
@@ -0,0 +1,120 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+
+from pathlib import Path
+from typing import Optional, Dict, Any
+from dotenv import load_dotenv
+from loguru import logger
+
+load_dotenv()
+
+BASE_DIR = Path(__file__).parent.parent
+FETCH_CACHE_DIR = os.getenv("FETCH_CACHE_DIR", str(BASE_DIR / ".fetch_cache"))
+FETCH_CACHE_TTL = int(os.getenv("FETCH_CACHE_TTL", 6 * 60 * 60))
+VALIDATED_CACHE_TTL = int(os.getenv("VALIDATED_CACHE_TTL", 30 * 24 * 60 * 60))
+
+
+class FetchCache:
+    """Content-addressed gzip cache of rendered pages and API responses.
+
+    Entries are keyed by the URL plus the options that shape the response
+    (selector, headers, browser...) and expire ``ttl`` seconds after being
+    written. A ``ttl`` of 0 disables the cache.
+    """
+
+    def __init__(self, directory: str = FETCH_CACHE_DIR, ttl: int = FETCH_CACHE_TTL):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def make_key(url: str, **options) -> str:
+        raw = json.dumps({"url": url, **options}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def get(self, url: str, **options) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        path = self._path(self.make_key(url, **options))
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def set(self, url: str, payload: Dict[str, Any], **options) -> None:
+        if not self.enabled:
+            return
+
+        path = self._path(self.make_key(url, **options))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(gzip.compress(
+                json.dumps(payload).encode("utf-8")))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed"""
+        if not self.directory.exists():
+            return 0
+
+        n_removed = 0
+        cutoff = time.time() - self.ttl
+        for path in self.directory.glob("*/*.json.gz"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    n_removed += 1
+            except OSError:
+                continue
+
+        return n_removed
+
+
+_fetch_cache: Optional[FetchCache] = None
+
+
+def get_fetch_cache() -> FetchCache:
+    global _fetch_cache
+
+    if _fetch_cache is None:
+        _fetch_cache = FetchCache()
+        if _fetch_cache.enabled:
+            n_removed = _fetch_cache.purge_expired()
+            logger.info(
+                f"Fetch cache at {_fetch_cache.directory} (TTL {_fetch_cache.ttl}s), purged {n_removed} expired entries")
+
+    return _fetch_cache
+
+
+_validated_cache: Optional[FetchCache] = None
+
+
+def get_validated_cache() -> FetchCache:
+    """Long-lived cache of bodies that can be revalidated with ETag/Last-Modified"""
+    global _validated_cache
+
+    if _validated_cache is None:
+        _validated_cache = FetchCache(
+            os.path.join(FETCH_CACHE_DIR, "validated"), VALIDATED_CACHE_TTL)
+        if _validated_cache.enabled:
+            _validated_cache.purge_expired()
+
+    return _validated_cache
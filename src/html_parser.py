@@ -0,0 +1,87 @@
+import os
+import re
+
+from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+from loguru import logger
+
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")
+FALLBACK_PARSER = "html.parser"
+SIMPLE_SELECTOR_PATTERN = re.compile(
+    r"^(?P<name>[a-zA-Z][\w-]*)?(?:(?P<kind>[#.])(?P<value>[\w-]+))?$")
+
+_available_parsers = {}
+
+
+class AnyOfStrainer(SoupStrainer):
+    """Keep a top-level tag, with everything inside it, if any strainer allows it.
+
+    Hooks into the tag creation checks of bs4 4.13's SoupStrainer, which the
+    public ``SoupStrainer(name=callable)`` cannot express since its callable
+    never sees the attributes; requirements.txt keeps bs4 on 4.13.
+    """
+
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(strainer.allow_tag_creation(nsprefix, name, attrs) for strainer in self.strainers)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def is_parser_available(parser: str) -> bool:
+    if parser not in _available_parsers:
+        try:
+            BeautifulSoup("", parser)
+            _available_parsers[parser] = True
+        except FeatureNotFound:
+            _available_parsers[parser] = False
+            logger.warning(
+                f"HTML parser {parser} is not installed, using {FALLBACK_PARSER}")
+
+    return _available_parsers[parser]
+
+
+def get_parser(parser: Optional[str] = None) -> str:
+    """Resolve the BeautifulSoup tree builder, falling back to html.parser if it is not installed"""
+    parser = parser or HTML_PARSER
+    return parser if is_parser_available(parser) else FALLBACK_PARSER
+
+
+def container_strainer(selector: str) -> Optional[SoupStrainer]:
+    """Build a strainer that only parses the container matched by a simple selector.
+
+    Meta tags and JSON-LD blocks are kept too, since transforms read og:image
+    and structured data from outside the product container. Selectors other
+    than ``tag``, ``#id``, ``.class``, ``tag#id`` and ``tag.class`` return None,
+    meaning the whole page is parsed.
+    """
+    match = SIMPLE_SELECTOR_PATTERN.match(selector.strip()) if selector else None
+    if not match or not (match.group("name") or match.group("kind")):
+        return None
+
+    attrs = {}
+    if match.group("kind") == "#":
+        attrs["id"] = match.group("value")
+    elif match.group("kind") == ".":
+        # The raw class attribute may hold several space-separated classes
+        attrs["class"] = re.compile(
+            r"(^|\s){}(\s|$)".format(re.escape(match.group("value"))))
+
+    return AnyOfStrainer(
+        SoupStrainer(match.group("name"), attrs),
+        SoupStrainer("meta"),
+        SoupStrainer("script", {"type": re.compile("ld\\+json")})
+    )
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML with the configured backend, optionally limited to a strainer"""
+    return BeautifulSoup(html, get_parser(parser), parse_only=parse_only)
@@ -0,0 +1,234 @@
+import asyncio
+import requests
+
+from datetime import datetime as dt
+from typing import Optional, Dict, Any, Callable
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from bs4 import BeautifulSoup, SoupStrainer
+from fake_useragent import UserAgent
+from loguru import logger
+from .rate_limiter import get_limiter
+from .fetch_cache import get_fetch_cache, get_validated_cache
+from .connection import Connection
+from .html_parser import make_soup
+
+HTTP_TIMEOUT = 30
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+BOT_WALL_STATUS_CODES = (403, 429, 503)
+BOT_WALL_MARKERS = [
+    'cf-chl-', '/cdn-cgi/challenge-platform', '<title>just a moment',
+    'attention required! | cloudflare', 'px-captcha', '_incapsula_resource',
+    'captcha-delivery.com', '<title>access denied'
+]
+
+CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+_session: Optional[requests.Session] = None
+_connection: Optional[Connection] = None
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session so repeated GETs reuse pooled connections"""
+    global _session
+
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                              pool_maxsize=POOL_MAXSIZE)
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+        _session.headers.update({
+            "User-Agent": UserAgent().random,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-GB,en;q=0.9",
+        })
+
+    return _session
+
+
+def _cache_options(headers: Optional[Dict[str, str]], kwargs: Dict) -> Dict:
+    # The user agent is randomised per call and validators only decide
+    # between 200 and 304, so neither changes the cached body
+    headers = {k: v for k, v in (headers or {}).items()
+               if k.lower() != "user-agent" and k.lower() not in CONDITIONAL_HEADERS}
+    return {"method": "GET", "headers": headers, "params": kwargs.get("params")}
+
+
+def _response_from_cache(url: str, cached: Dict) -> requests.Response:
+    response = requests.Response()
+    response.url = url
+    response.status_code = cached["status_code"]
+    response.headers = CaseInsensitiveDict(cached["headers"])
+    response.encoding = "utf-8"
+    response._content = cached["text"].encode("utf-8")
+    return response
+
+
+def http_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = HTTP_TIMEOUT,
+    min_interval: Optional[float] = None,
+    max_interval: Optional[float] = None,
+    use_cache: bool = True,
+    refresh: bool = False,
+    **kwargs
+) -> requests.Response:
+    """GET through the shared session, paced and fed back to the host's rate limiter.
+
+    Successful responses are kept in the fetch cache, so reruns within its TTL
+    are served from disk without contacting the host. ``refresh`` always goes
+    to the host but still stores the response.
+    """
+    cache = get_fetch_cache()
+    cache_options = _cache_options(headers, kwargs)
+    if use_cache and not refresh:
+        cached = cache.get(url, **cache_options)
+        if cached is not None:
+            logger.info(f"Using cached response for {url}")
+            return _response_from_cache(url, cached)
+
+    limiter = get_limiter(url, min_interval, max_interval)
+    limiter.wait_sync()
+
+    try:
+        response = get_session().get(url, headers=headers, timeout=timeout, **kwargs)
+    except (requests.Timeout, requests.ConnectionError):
+        limiter.record_failure()
+        raise
+
+    limiter.record_status(response.status_code,
+                          response.headers.get("Retry-After"))
+
+    if use_cache and response.status_code == 200 and not is_bot_wall(response):
+        cache.set(url, {
+            "status_code": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+            "text": response.text,
+        }, **cache_options)
+
+    return response
+
+
+async def http_get_async(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
+    """``http_get`` on a worker thread, so side calls made while pages render do not block the event loop.
+
+    Every call still goes through the shared session, reusing its pooled
+    keep-alive connections to the host.
+    """
+    return await asyncio.to_thread(http_get, url, headers=headers, **kwargs)
+
+
+def get_connection() -> Connection:
+    global _connection
+
+    if _connection is None:
+        _connection = Connection()
+
+    return _connection
+
+
+def conditional_get(url: str, headers: Optional[Dict[str, str]] = None, need_body: bool = True, **kwargs) -> requests.Response:
+    """GET with the validators stored for the URL.
+
+    A 304 is flagged with ``response.not_modified``; when ``need_body`` is set
+    its body is restored from the validated cache, and validators are only
+    sent if that body is still available.
+    """
+    validated_cache = get_validated_cache()
+    cache_options = _cache_options(headers, kwargs)
+    validators = get_connection().get_url_validators(url)
+    body = validated_cache.get(url, **cache_options) if need_body else None
+
+    request_headers = dict(headers or {})
+    if validators and (body is not None or not need_body):
+        if validators["etag"]:
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = http_get(url, headers=request_headers, refresh=True, **kwargs)
+
+    if response.status_code == 304:
+        logger.info(f"Not modified since last run: {url}")
+        if need_body:
+            response = _response_from_cache(url, body)
+        response.not_modified = True
+        return response
+
+    response.not_modified = False
+    if need_body and response.status_code == 200 and has_validators(response):
+        validated_cache.set(url, {
+            "status_code": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+            "text": response.text,
+        }, **cache_options)
+
+    return response
+
+
+def has_validators(response: requests.Response) -> bool:
+    return bool(response.headers.get("ETag") or response.headers.get("Last-Modified"))
+
+
+def remember_validators(url: str, response: requests.Response) -> None:
+    """Store the response's validators so the next run can send a conditional GET"""
+    if response.status_code != 200 or not has_validators(response):
+        return
+
+    now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+    get_connection().set_url_validators(
+        url, response.headers.get("ETag"), response.headers.get("Last-Modified"), now)
+
+
+def is_bot_wall(response: requests.Response) -> bool:
+    """Detect captcha, challenge and access-denied pages served instead of content"""
+    if response.status_code in BOT_WALL_STATUS_CODES:
+        return True
+
+    head = response.text[:20000].lower()
+    return any(marker in head for marker in BOT_WALL_MARKERS)
+
+
+async def fetch_html(url: str, selector: str, headers: Optional[Dict[str, str]] = None, parse_only: Optional[SoupStrainer] = None, parse: Optional[Callable[[str], Any]] = None) -> Optional[BeautifulSoup]:
+    """Fetch a page with a plain HTTP GET and return it only if it already holds the selector.
+
+    With ``parse`` the page is returned as parsed by it instead of as a soup,
+    and it counts as complete when the parsed result is truthy.
+    """
+    try:
+        response = await asyncio.to_thread(http_get, url, headers=headers)
+    except requests.RequestException as e:
+        logger.warning(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    if is_bot_wall(response):
+        logger.warning(
+            f"Bot wall detected on HTTP fetch of {url} ({response.status_code})")
+        return None
+
+    if response.status_code != 200:
+        logger.warning(
+            f"HTTP fetch of {url} returned {response.status_code}")
+        return None
+
+    if parse:
+        document = parse(response.text)
+        if not document:
+            logger.info(f"Embedded data missing from raw HTML of {url}")
+            return None
+
+        logger.success(f"Successfully fetched {url} without a browser")
+        return document
+
+    soup = make_soup(response.text, parse_only)
+    if soup.select_one(selector) is None:
+        logger.info(
+            f"Selector {selector} missing from raw HTML of {url}")
+        return None
+
+    logger.success(f"Successfully fetched {url} without a browser")
+    return soup
@@ -0,0 +1,105 @@
+import json
+import threading
+
+from collections import deque
+from typing import Optional, Dict
+from loguru import logger
+from .rate_limiter import get_host
+
+NAVIGATION = "navigation"
+SELECTOR = "selector"
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_SAFETY_FACTOR = 3
+MIN_TIMEOUT = 5000
+MAX_TIMEOUT = 60000
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class HostLatency:
+    """Navigation and selector latencies of one host, turned into timeouts.
+
+    Once ``MIN_LATENCY_SAMPLES`` successful loads are observed, a timeout is
+    the ``TIMEOUT_PERCENTILE`` of the last ``LATENCY_WINDOW`` of them times
+    ``TIMEOUT_SAFETY_FACTOR``, kept between ``MIN_TIMEOUT`` and
+    ``MAX_TIMEOUT``. Until then the percentile saved by the previous run is
+    used, and without one the caller's default.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.samples = {NAVIGATION: deque(maxlen=LATENCY_WINDOW),
+                        SELECTOR: deque(maxlen=LATENCY_WINDOW)}
+        self.learned: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.samples[kind].append(elapsed_ms)
+
+    def high_percentile(self, kind: str) -> Optional[float]:
+        with self._lock:
+            samples = list(self.samples[kind])
+
+        if len(samples) >= MIN_LATENCY_SAMPLES:
+            return percentile(samples, TIMEOUT_PERCENTILE)
+        return self.learned.get(kind)
+
+    def timeout(self, kind: str, default: int) -> int:
+        """Timeout in ms for the next wait of this kind, never above ``default``"""
+        latency = self.high_percentile(kind)
+        if latency is None:
+            return default
+
+        timeout = min(max(latency * TIMEOUT_SAFETY_FACTOR, MIN_TIMEOUT), MAX_TIMEOUT)
+        return int(min(timeout, default))
+
+    def load(self, state: Optional[str]) -> None:
+        """Seed the timeouts with the percentiles saved by a previous run"""
+        if not state:
+            return
+
+        try:
+            self.learned = {kind: float(value) for kind, value in json.loads(state).items()
+                            if kind in self.samples}
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring saved latencies of {self.host}: {e}")
+
+    def dump(self) -> Optional[str]:
+        """Percentiles to save for the next run, or None if nothing was learned"""
+        learned = {kind: round(self.high_percentile(kind)) for kind in self.samples
+                   if self.high_percentile(kind) is not None}
+        return json.dumps(learned) if learned else None
+
+    def summary(self) -> str:
+        parts = []
+        for kind in self.samples:
+            latency = self.high_percentile(kind)
+            if latency is None:
+                parts.append(f"{kind} not learned")
+            else:
+                parts.append(f"{kind} p{TIMEOUT_PERCENTILE * 100:.0f} {latency:.0f} ms -> timeout "
+                             f"{self.timeout(kind, MAX_TIMEOUT)} ms ({len(self.samples[kind])} sample(s))")
+        return f"Latency of {self.host}: " + ", ".join(parts)
+
+
+_latencies: Dict[str, HostLatency] = {}
+_registry_lock = threading.Lock()
+
+
+def get_latency(url: str) -> HostLatency:
+    """Get the latency tracker shared by every scrape of the URL's host"""
+    host = get_host(url)
+
+    with _registry_lock:
+        latency = _latencies.get(host)
+        if latency is None:
+            latency = HostLatency(host)
+            _latencies[host] = latency
+
+    return latency
@@ -2,18 +2,25 @@
 import asyncio
 import requests
 import time
+import threading
 
+from collections import deque
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List, Tuple
 from fp.fp import FreeProxy
-from bs4 import BeautifulSoup
+from .html_parser import make_soup
+from .rate_limiter import get_host
 from fake_useragent import UserAgent
 
 from loguru import logger
 
 PROXY_CACHE_SIZE = 50
 PROXY_VALIDATION_TIMEOUT = 5
+DIRECT_WINDOW = 20
+DIRECT_BLOCKS_TO_SWITCH = 3
+DIRECT = "direct"
+PROXIED = "proxy"
 
 
 @dataclass
@@ -77,7 +84,7 @@ class ProxyRotator:
         # Fallback to scraping HTML
         try:
             response = requests.get("https://free-proxy-list.net/", timeout=10)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
 
             table = soup.find('table', {'id': 'proxylisttable'})
             if not table:
@@ -186,3 +193,54 @@ class ProxyRotator:
 
             proxy_info.last_used = time.time()
             return proxy_info.proxy
+
+
+class HostConnectionPolicy:
+    """Whether a host still serves direct connections or needs proxies.
+
+    Only direct attempts teach it: once ``DIRECT_BLOCKS_TO_SWITCH`` of the
+    last ``DIRECT_WINDOW`` of them were blocked, the host is proxied for the
+    rest of the run. The mode is persisted per shop, so a later run starts
+    where this one ended.
+    """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.mode = DIRECT
+        self.outcomes = deque(maxlen=DIRECT_WINDOW)
+        self._lock = threading.Lock()
+
+    def needs_proxy(self) -> bool:
+        return self.mode == PROXIED
+
+    def record(self, proxy: Optional[str], blocked: bool) -> None:
+        if proxy:
+            return
+
+        with self._lock:
+            self.outcomes.append(blocked)
+            if self.mode == DIRECT and self.outcomes.count(True) >= DIRECT_BLOCKS_TO_SWITCH:
+                self.mode = PROXIED
+                logger.warning(
+                    f"{self.host} blocked {DIRECT_BLOCKS_TO_SWITCH} direct attempt(s), switching to proxies")
+
+    def load(self, mode: Optional[str]) -> None:
+        if mode in (DIRECT, PROXIED):
+            self.mode = mode
+
+
+_connection_policies: Dict[str, HostConnectionPolicy] = {}
+_registry_lock = threading.Lock()
+
+
+def get_connection_policy(url: str) -> HostConnectionPolicy:
+    """Get the connection policy shared by every scrape of the URL's host"""
+    host = get_host(url)
+
+    with _registry_lock:
+        policy = _connection_policies.get(host)
+        if policy is None:
+            policy = HostConnectionPolicy(host)
+            _connection_policies[host] = policy
+
+    return policy
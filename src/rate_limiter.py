@@ -0,0 +1,118 @@
+import time
+import random
+import asyncio
+import threading
+
+from typing import Optional, Dict
+from urllib.parse import urlparse
+from loguru import logger
+
+DEFAULT_MIN_INTERVAL = 0.2
+DEFAULT_MAX_INTERVAL = 1.0
+MAX_BACKOFF_INTERVAL = 120
+RATE_INCREASE_STEP = 0.05  # requests/sec added after each healthy response
+BACKOFF_FACTOR = 2
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+class HostRateLimiter:
+    """Token bucket (burst of one) per host whose rate follows AIMD feedback.
+
+    Healthy responses raise the rate additively down to ``min_interval`` between
+    requests; throttling and timeouts halve it, honouring ``Retry-After``.
+    Slots are reserved under a thread lock so async and sync callers share it.
+    """
+
+    def __init__(self, host: str, min_interval: float = DEFAULT_MIN_INTERVAL, max_interval: float = DEFAULT_MAX_INTERVAL):
+        self.host = host
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = max_interval
+        self.backoff_until = 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def set_bounds(self, min_interval: float, max_interval: float) -> None:
+        with self._lock:
+            self.min_interval = min_interval
+            self.max_interval = max_interval
+            self.interval = min(max(self.interval, min_interval),
+                                MAX_BACKOFF_INTERVAL)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot, self.backoff_until)
+            self._next_slot = slot + \
+                random.uniform(self.interval, self.interval * 1.25)
+            return slot - now
+
+    async def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def wait_sync(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.interval <= self.min_interval:
+                return
+            rate = 1 / self.interval + RATE_INCREASE_STEP
+            self.interval = max(self.min_interval, 1 / rate)
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self.interval = min(MAX_BACKOFF_INTERVAL,
+                                max(self.interval, DEFAULT_MIN_INTERVAL) * BACKOFF_FACTOR)
+            if retry_after:
+                self.backoff_until = time.monotonic() + retry_after
+
+        logger.warning(
+            f"Backing off {self.host}: {self.interval:.2f}s between requests")
+
+    def record_status(self, status_code: int, retry_after: Optional[str] = None) -> None:
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_failure(_parse_retry_after(retry_after))
+        elif status_code < 400:
+            self.record_success()
+
+
+_limiters: Dict[str, HostRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return min(float(value), MAX_BACKOFF_INTERVAL) if value else None
+    except ValueError:
+        return None
+
+
+def get_host(url: str) -> str:
+    host = urlparse(url).netloc.lower() or url.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def get_limiter(url: str, min_interval: Optional[float] = None, max_interval: Optional[float] = None) -> HostRateLimiter:
+    """Get the limiter shared by every fetch to the URL's host, updating its bounds if given"""
+    host = get_host(url)
+
+    with _registry_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = HostRateLimiter(
+                host,
+                min_interval if min_interval is not None else DEFAULT_MIN_INTERVAL,
+                max_interval if max_interval is not None else DEFAULT_MAX_INTERVAL
+            )
+            _limiters[host] = limiter
+            return limiter
+
+    if min_interval is not None and max_interval is not None:
+        limiter.set_bounds(min_interval, max_interval)
+
+    return limiter
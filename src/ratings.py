@@ -0,0 +1,198 @@
+import os
+import asyncio
+import requests
+
+from dataclasses import dataclass
+from datetime import datetime as dt
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from urllib.parse import quote
+from dotenv import load_dotenv
+from loguru import logger
+from .http_client import http_get_async, get_connection
+
+load_dotenv()
+
+RATINGS_TTL_DAYS = int(os.getenv("RATINGS_TTL_DAYS", 7))
+BATCH_WINDOW = 0.25
+FEEFO_API = "https://api.feefo.com/api/10"
+FEEFO_BATCH_SIZE = 20
+TRUSTPILOT_API = "https://widget.trustpilot.com/trustbox-data"
+
+
+@dataclass(eq=False)
+class RatingSource:
+    """Where the product ratings of one merchant come from.
+
+    ``url`` builds the request for a batch of SKUs and ``read`` maps its JSON
+    to sku -> rating, with None for products that have no reviews yet. SKUs
+    requested within ``BATCH_WINDOW`` of each other share one request, up to
+    ``batch_size`` of them.
+    """
+    name: str
+    url: Callable[[List[str]], str]
+    read: Callable[[Any, List[str]], Dict[str, Optional[float]]]
+    batch_size: int = 1
+
+
+def _read_summary(data: Any, skus: List[str]) -> Dict[str, Optional[float]]:
+    rating = (data.get("rating") or {}).get("rating")
+    return {skus[0]: float(rating) if rating is not None else None}
+
+
+def _read_products(data: Any, skus: List[str]) -> Dict[str, Optional[float]]:
+    products = [product for product in data.get("products", []) if "rating" in product]
+    if len(skus) == 1:
+        return {skus[0]: float(products[0]["rating"]) if products else None}
+
+    ratings = {str(product.get("sku")): float(product["rating"]) for product in products}
+    return {sku: ratings.get(sku) for sku in skus}
+
+
+def _read_trustbox(data: Any, skus: List[str]) -> Dict[str, Optional[float]]:
+    rating = (data.get("productReviewsSummary") or {}).get("starsAverage")
+    return {skus[0]: float(rating) if rating is not None else None}
+
+
+def format_rating(rating: Optional[float]) -> str:
+    """Rating as the APIs print it, e.g. "5/5" or "4.8/5", or "0/5" without one"""
+    # Cached ratings come back as floats, possibly with FLOAT rounding noise
+    return f"{round(rating or 0, 2):g}/5"
+
+
+def feefo_summary(merchant: str, origin: str, sku_param: str = "parent_product_sku", imported: bool = False) -> RatingSource:
+    """Feefo review summary of one product, identified by ``sku_param``"""
+    reviews = "importedreviews" if imported else "reviews"
+    return RatingSource(
+        f"feefo:{merchant}:{reviews}:{sku_param}",
+        lambda skus: (f"{FEEFO_API}/{reviews}/summary/product?since_period=ALL&{sku_param}={quote(skus[0])}"
+                      f"&merchant_identifier={merchant}&origin={origin}"),
+        _read_summary
+    )
+
+
+def feefo_product_ratings(merchant: str) -> RatingSource:
+    """Feefo product ratings, which take a comma-separated list of SKUs"""
+    return RatingSource(
+        f"feefo:{merchant}:products",
+        lambda skus: (f"{FEEFO_API}/products/ratings?merchant_identifier={merchant}&review_count=true"
+                      f"&product_sku={','.join(quote(sku) for sku in skus)}"),
+        _read_products,
+        batch_size=FEEFO_BATCH_SIZE
+    )
+
+
+def trustpilot_trustbox(template_id: str, business_unit_id: str, locale: str = "en-GB") -> RatingSource:
+    """Trustpilot TrustBox data, whose SKU is the comma-separated list of a product's variants"""
+    return RatingSource(
+        f"trustpilot:{business_unit_id}",
+        lambda skus: (f"{TRUSTPILOT_API}/{template_id}?businessUnitId={business_unit_id}"
+                      f"&locale={locale}&sku={'%2C'.join(skus[0].split(','))}"),
+        _read_trustbox
+    )
+
+
+class RatingsService:
+    """Product ratings shared across transforms and cached in the database for ``ttl_days``.
+
+    The fresh ratings of a source are loaded in one query the first time it
+    is used, so within the TTL a run makes no rating requests at all.
+    Concurrent lookups of the same SKU share one request, and failed
+    requests are not cached so the next run asks again.
+    """
+
+    def __init__(self, ttl_days: int = RATINGS_TTL_DAYS):
+        self.ttl_days = ttl_days
+        self.ratings: Dict[str, Dict[str, Optional[float]]] = {}
+        self.pending: Dict[str, List[str]] = {}
+        self.in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self.n_cached = 0
+        self.n_requests = 0
+        self.n_failed = 0
+
+    def _load(self, source: RatingSource) -> Dict[str, Optional[float]]:
+        if source.name not in self.ratings:
+            self.ratings[source.name] = {}
+            if self.ttl_days > 0:
+                self.ratings[source.name] = get_connection().get_product_ratings(
+                    source.name, self.ttl_days)
+                logger.info(
+                    f"Loaded {len(self.ratings[source.name])} cached rating(s) from {source.name}")
+
+        return self.ratings[source.name]
+
+    async def get_rating(self, source: RatingSource, sku: Optional[str]) -> Optional[float]:
+        """Rating of the product out of 5, or None if it has none or it could not be fetched"""
+        if not sku:
+            return None
+
+        ratings = self._load(source)
+        if sku in ratings:
+            self.n_cached += 1
+            return ratings[sku]
+
+        key = (source.name, sku)
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.in_flight[key] = future
+            self._enqueue(source, sku)
+
+        return await future
+
+    def _enqueue(self, source: RatingSource, sku: str) -> None:
+        batch = self.pending.setdefault(source.name, [])
+        batch.append(sku)
+
+        if len(batch) >= source.batch_size:
+            self._flush(source)
+        elif len(batch) == 1:
+            asyncio.get_running_loop().call_later(BATCH_WINDOW, self._flush, source)
+
+    def _flush(self, source: RatingSource) -> None:
+        skus = self.pending.pop(source.name, [])
+        if skus:
+            asyncio.ensure_future(self._fetch(source, skus))
+
+    async def _fetch(self, source: RatingSource, skus: List[str]) -> None:
+        url = source.url(skus)
+        ratings = None
+        self.n_requests += 1
+        try:
+            response = await http_get_async(url, use_cache=False)
+            if response.status_code == 200:
+                ratings = source.read(response.json(), skus)
+            else:
+                logger.warning(f"Rating request {url} returned {response.status_code}")
+        except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Rating request {url} failed: {e}")
+
+        if ratings is None:
+            self.n_failed += 1
+        else:
+            self.ratings[source.name].update(ratings)
+            now = dt.now().strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                get_connection().set_product_ratings(source.name, ratings, now)
+            except Exception as e:
+                logger.error(f"Could not cache ratings of {source.name}: {e}")
+
+        for sku in skus:
+            future = self.in_flight.pop((source.name, sku), None)
+            if future is not None and not future.done():
+                future.set_result(ratings.get(sku) if ratings else None)
+
+    def summary(self) -> str:
+        return (f"Ratings: {self.n_cached} served from cache, {self.n_requests} request(s), "
+                f"{self.n_failed} failed")
+
+
+_ratings_service: Optional[RatingsService] = None
+
+
+def get_ratings_service() -> RatingsService:
+    global _ratings_service
+
+    if _ratings_service is None:
+        _ratings_service = RatingsService()
+
+    return _ratings_service
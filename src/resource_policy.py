@@ -0,0 +1,147 @@
+import re
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, FrozenSet, Dict
+from urllib.parse import urlparse
+
+# Typical transfer sizes, used to estimate savings for resource types the
+# browser never fetched in this run
+TYPICAL_RESOURCE_BYTES = {
+    "image": 60_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 80_000,
+    "xhr": 10_000,
+    "fetch": 10_000,
+    "other": 10_000,
+}
+
+TRACKER_PATTERNS = (
+    'analytics', 'ads', 'tracking', 'metrics', 'telemetry',
+    'facebook.com', 'google-analytics', 'googletagmanager',
+    'doubleclick.net', 'adsystem.com', 'amazon-adsystem.com'
+)
+
+
+@dataclass
+class ResourceStats:
+    allowed: Counter = field(default_factory=Counter)
+    blocked: Counter = field(default_factory=Counter)
+    observed_bytes: Counter = field(default_factory=Counter)
+    observed_responses: Counter = field(default_factory=Counter)
+
+    def record_response(self, resource_type: str, content_length: Optional[str]) -> None:
+        if content_length and content_length.isdigit():
+            self.observed_bytes[resource_type] += int(content_length)
+            self.observed_responses[resource_type] += 1
+
+    def estimated_bytes_saved(self) -> int:
+        total = 0
+        for resource_type, n_blocked in self.blocked.items():
+            if self.observed_responses[resource_type]:
+                average = self.observed_bytes[resource_type] / \
+                    self.observed_responses[resource_type]
+            else:
+                average = TYPICAL_RESOURCE_BYTES.get(resource_type, 10_000)
+            total += n_blocked * average
+
+        return int(total)
+
+
+@dataclass(eq=False)
+class ResourcePolicy:
+    """Declarative description of what a shop's pages are allowed to load.
+
+    ``block_types`` are Playwright resource types aborted outright and
+    ``block_patterns`` URL fragments aborted for any type.
+    ``third_party_scripts`` is an allowlist of fragments for scripts served
+    from other hosts than the shop (None allows all of them) and
+    ``xhr_allow`` does the same for XHR/fetch calls to any host.
+    With ``javascript`` off the context is created without JavaScript.
+    """
+    name: str
+    javascript: bool = True
+    block_types: FrozenSet[str] = frozenset({'image', 'media', 'font', 'other'})
+    block_patterns: Tuple[str, ...] = TRACKER_PATTERNS
+    third_party_scripts: Optional[Tuple[str, ...]] = None
+    xhr_allow: Optional[Tuple[str, ...]] = None
+    stats: ResourceStats = field(default_factory=ResourceStats)
+
+    def __post_init__(self):
+        self._blocked_url = _compile(self.block_patterns)
+        self._allowed_scripts = _compile(self.third_party_scripts)
+        self._allowed_xhr = _compile(self.xhr_allow)
+
+    @property
+    def needs_routing(self) -> bool:
+        return bool(self.block_types or self.block_patterns
+                    or self.third_party_scripts is not None or self.xhr_allow is not None)
+
+    def should_block(self, url: str, resource_type: str, first_party: Optional[str] = None) -> bool:
+        if resource_type in self.block_types:
+            return True
+
+        if self._blocked_url and self._blocked_url.search(url):
+            return True
+
+        if resource_type in ("xhr", "fetch") and self.xhr_allow is not None:
+            return not (self._allowed_xhr and self._allowed_xhr.search(url))
+
+        if resource_type == "script" and self.third_party_scripts is not None \
+                and first_party and not is_first_party(url, first_party):
+            return not (self._allowed_scripts and self._allowed_scripts.search(url))
+
+        return False
+
+    def record(self, resource_type: str, blocked: bool) -> None:
+        (self.stats.blocked if blocked else self.stats.allowed)[
+            resource_type] += 1
+
+    def summary(self) -> str:
+        n_blocked = sum(self.stats.blocked.values())
+        n_total = n_blocked + sum(self.stats.allowed.values())
+        blocked_types = ", ".join(
+            f"{resource_type}={n}" for resource_type, n in self.stats.blocked.most_common())
+        return (f"Resource policy {self.name}: blocked {n_blocked} of {n_total} request(s), "
+                f"~{self.stats.estimated_bytes_saved() / 1024 / 1024:.1f} MB saved"
+                + (f" ({blocked_types})" if blocked_types else ""))
+
+
+def _compile(patterns: Optional[Tuple[str, ...]]) -> Optional[re.Pattern]:
+    # One alternation is matched in C instead of a Python loop per pattern
+    if not patterns:
+        return None
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+
+
+def is_first_party(url: str, first_party: str) -> bool:
+    host = urlparse(url).netloc.lower()
+    return host == first_party or host.endswith("." + first_party)
+
+
+# Images, media, fonts and trackers are dropped; everything else loads
+DEFAULT_POLICY = ResourcePolicy("default")
+
+# For pages whose data is in the server-rendered HTML: no stylesheets and
+# only first-party scripts, which still run bot challenges and hydration
+LEAN_POLICY = ResourcePolicy(
+    "lean",
+    block_types=frozenset(
+        {'image', 'media', 'font', 'other', 'stylesheet'}),
+    third_party_scripts=()
+)
+
+# For pages that need no JavaScript at all to hold the selector
+STATIC_POLICY = ResourcePolicy(
+    "static",
+    javascript=False,
+    block_types=frozenset(
+        {'image', 'media', 'font', 'other', 'stylesheet', 'script', 'xhr', 'fetch'}),
+    block_patterns=()
+)
+
+POLICIES: Dict[str, ResourcePolicy] = {
+    policy.name: policy for policy in (DEFAULT_POLICY, LEAN_POLICY, STATIC_POLICY)
+}
@@ -1,16 +1,27 @@
+import os
+import re
 import random
 
 import asyncio
 import nest_asyncio
 import json
 import time
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from fake_useragent import UserAgent
-from .proxy import ProxyRotator
-from bs4 import BeautifulSoup
+from .proxy import ProxyRotator, get_connection_policy
+from .rate_limiter import get_limiter, get_host, THROTTLE_STATUS_CODES
+from .circuit_breaker import get_breaker, CircuitOpenError
+from .latency import get_latency, NAVIGATION, SELECTOR
+from .browser_manager import get_browser_manager, ManagedBrowser
+from .fetch_cache import get_fetch_cache
+from .resource_policy import ResourcePolicy, DEFAULT_POLICY
+from .html_parser import make_soup
+from bs4 import BeautifulSoup, SoupStrainer
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -19,9 +30,11 @@ from tenacity import (
     before_sleep_log
 )
 
+from dotenv import load_dotenv
 from loguru import logger
 
 nest_asyncio.apply()
+load_dotenv()
 
 # Configuration constants
 MAX_RETRIES = 5
@@ -31,7 +44,135 @@ REQUEST_TIMEOUT = 60000
 PAGE_LOAD_TIMEOUT = 60000
 
 MAX_PROXY_RETRIES = 10
-BROWSER_RESTART_INTERVAL = 20
+BROWSER_RESTART_INTERVAL = int(os.getenv("BROWSER_RESTART_INTERVAL", 20))
+CONTEXT_RECYCLE_INTERVAL = int(os.getenv("CONTEXT_RECYCLE_INTERVAL", 20))
+# Memory envelope of one browser's process tree, sampled every few pages
+BROWSER_MAX_RSS_MB = int(os.getenv("BROWSER_MAX_RSS_MB", 1536))
+CONTEXT_RECYCLE_RSS_RATIO = 0.75
+RSS_SAMPLE_INTERVAL = 10
+MAX_CONTEXTS = 4
+CAPTURE_TIMEOUT = 15000
+GONE_STATUS_CODES = (404, 410)
+BLOCKED_STATUS_CODES = (403,)
+
+# What each retry of a URL rebuilds, cheapest first; the last step repeats
+RELOAD = "reload"
+NEW_CONTEXT = "new context"
+NEW_BROWSER = "new browser"
+RETRY_LADDER = (RELOAD, NEW_CONTEXT, NEW_CONTEXT, NEW_BROWSER)
+
+# Lower-cased texts of pages saying the product is gone, matched only while its selector is missing
+UNAVAILABLE_MARKERS = (
+    "product is no longer available",
+    "product not found",
+    "product has been discontinued",
+    "item is no longer available",
+    "page not found",
+    "page you are looking for",
+    "page cannot be found",
+)
+
+# Outcomes a page can settle on besides showing its selector
+CHALLENGE_SELECTORS = (
+    "#challenge-form", "#challenge-stage", "#cf-challenge-running",
+    "iframe[src*='challenges.cloudflare.com']", "iframe[src*='captcha-delivery.com']",
+    "iframe[src*='recaptcha']", "iframe[src*='hcaptcha']", "#px-captcha",
+)
+CHALLENGE_TITLES = ("just a moment", "attention required", "access denied", "verify you are human")
+CONSENT_ACCEPT_SELECTORS = (
+    "#onetrust-accept-btn-handler",
+    "#CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll",
+    "#CybotCookiebotDialogBodyButtonAccept",
+    "button[data-testid='uc-accept-all-button']",
+)
+EMPTY_LISTING_TEXTS = (
+    "no products found", "no results found", "no products were found", "couldn't find any products",
+)
+OUTCOME_POLLING = 250
+
+# Settles on the first outcome the page shows, checking bot challenges first
+# so that a challenge page can never pass for a missing product
+OUTCOME_SCRIPT = """
+([selector, challengeSelectors, challengeTitles, notFoundTexts, consentSelectors, emptyTexts]) => {
+    const title = document.title.toLowerCase();
+    if (challengeSelectors.some(s => document.querySelector(s))
+            || challengeTitles.some(t => title.includes(t))) {
+        return "challenge";
+    }
+    if (!selector || document.querySelector(selector)) {
+        return "success";
+    }
+    const text = document.body ? document.body.innerText.toLowerCase() : "";
+    if (notFoundTexts.some(t => text.includes(t))) {
+        return "not_found";
+    }
+    if (consentSelectors.some(s => document.querySelector(s))) {
+        return "consent";
+    }
+    if (emptyTexts.some(t => text.includes(t))) {
+        return "empty";
+    }
+    return null;
+}
+"""
+
+# Nodes kept outside the container when extraction is scoped to the selector
+SCOPE_KEEP_SELECTORS = (
+    "head meta", "meta[property='og:image']", "script[type*='ld+json']")
+
+SCOPED_CONTENT_SCRIPT = """
+([selector, keepSelectors]) => {
+    const container = document.querySelector(selector);
+    const kept = new Set(container ? [container] : []);
+    for (const keepSelector of keepSelectors) {
+        for (const node of document.querySelectorAll(keepSelector)) {
+            if (!container || !container.contains(node)) kept.add(node);
+        }
+    }
+    // Keep the document order, shops index into e.g. their ld+json blocks
+    const nodes = Array.from(kept).sort(
+        (a, b) => a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1);
+    const inHead = node => document.head !== null && document.head.contains(node);
+    const html = nodes => nodes.map(node => node.outerHTML).join("");
+    const head = html(nodes.filter(inHead));
+    const body = html(nodes.filter(node => !inHead(node)));
+    return `<html><head>${head}</head><body>${body}</body></html>`;
+}
+"""
+
+
+@dataclass
+class CapturedResponse:
+    url: str
+    status: int
+    data: Any
+
+
+@dataclass
+class EvaluatedPage:
+    url: str
+    data: Any
+    html: Optional[str] = None
+
+
+@dataclass
+class ContextSlot:
+    """A browser context bound to one proxy identity, with its own idle page pool"""
+    context: BrowserContext
+    proxy: str
+    idle_pages: List[Page] = field(default_factory=list)
+    pages_in_flight: int = 0
+    pages_served: int = 0
+    retired: bool = False
+    recycle_requested: bool = False
+
+
+@dataclass
+class FailedAttempts:
+    """Failed attempts at one URL, which decide how far the next retry escalates"""
+    count: int
+    blocked: bool
+    proxy: str
 
 
 class SkipScrape(Exception):
@@ -44,15 +185,40 @@ class ScrapingError(Exception):
     pass
 
 
+class BlockedError(ScrapingError):
+    """The host refused the identity (forbidden, throttled or challenged), not the page"""
+    pass
+
+
 class WebScraper:
     def __init__(self):
         self.ua = UserAgent()
         self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-        self.playwright_instance = None
+        self.managed_browser: Optional[ManagedBrowser] = None
         self.pages_scraped = 0
         self.restart_browser_every = BROWSER_RESTART_INTERVAL
-        self.current_proxy = None
+        self.recycle_context_every = CONTEXT_RECYCLE_INTERVAL
+        self.max_browser_rss = BROWSER_MAX_RSS_MB * 1024 * 1024
+        self.sample_rss_every = RSS_SAMPLE_INTERVAL
+        self.peak_rss = 0
+        self.n_memory_recycles = 0
+        self.max_contexts = MAX_CONTEXTS
+        self.current_browser_type = None
+        self.pages_since_restart = 0
+        self.restart_requested = False
+        self.contexts: Dict[str, ContextSlot] = {}
+        self.retired_contexts: List[ContextSlot] = []
+        self.pending_proxies: List[str] = []
+        self.proxy_rotator = ProxyRotator()
+        self.resource_policy = DEFAULT_POLICY
+        self.first_party: Optional[str] = None
+        self.unavailable_markers = UNAVAILABLE_MARKERS
+        # Only listing pages can be empty; scrapers of product pages clear these
+        self.empty_listing_texts = EMPTY_LISTING_TEXTS
+        self.skipped: Dict[str, str] = {}
+        self.failures: Dict[str, FailedAttempts] = {}
+        self._browser_lock = asyncio.Lock()
+        self._proxy_lock = asyncio.Lock()
 
     def get_headers(self, headers=None) -> Dict[str, str]:
         """Generate realistic browser headers with better randomization"""
@@ -88,16 +254,131 @@ class WebScraper:
 
         return default_headers
 
-    async def setup_browser(self, proxy, browser_type: str = "firefox") -> None:
-        """Initialize browser with enhanced configuration"""
-        self.browser = None
-
-        self.playwright_instance = await async_playwright().start()
-
-        logger.info(f"Using proxy {proxy}")
+    def use_resource_policy(self, policy: ResourcePolicy, base_url: Optional[str] = None) -> None:
+        """Load pages under the given policy, treating the base URL's host as first party"""
+        if policy is not self.resource_policy:
+            # JavaScript and routing are fixed when the context is created
+            self.restart_requested = self.browser is not None
+        self.resource_policy = policy
+        self.first_party = get_host(base_url) if base_url else None
+
+    @property
+    def pages_in_flight(self) -> int:
+        return sum(slot.pages_in_flight for slot in list(self.contexts.values()) + self.retired_contexts)
+
+    def needs_restart(self, browser_type: str) -> bool:
+        """Check whether the running browser can host the next page"""
+        if self.browser is None:
+            return True
+
+        if not self.browser.is_connected() or self.restart_requested:
+            return True
+
+        if browser_type != self.current_browser_type:
+            return True
+
+        return self.pages_since_restart >= self.restart_browser_every
+
+    async def next_proxy(self) -> Optional[str]:
+        """Reuse the proxy of an idle context, or rotate in a new one while the pool has room"""
+        async with self._proxy_lock:
+            # Proxies handed out but not bound to a context yet count as busy
+            candidates = [(slot.pages_in_flight, slot.proxy) for slot in self.contexts.values() if slot.proxy] + \
+                [(1, proxy) for proxy in self.pending_proxies]
+            if candidates:
+                pages_in_flight, proxy = min(candidates)
+                if pages_in_flight == 0 or len(candidates) >= self.max_contexts:
+                    return proxy
+
+            proxy = await self.proxy_rotator.get_proxy()
+            if proxy:
+                self.pending_proxies.append(proxy)
+            return proxy
+
+    async def plan_attempt(self, url: str, proxy: Optional[bool]) -> str:
+        """Prepare the next attempt at the URL and return the proxy it should use.
+
+        Each failure escalates along ``RETRY_LADDER``: the first retry reloads
+        in the same context, the next ones retire it for a fresh identity and
+        the last relaunches the browser. Blocked attempts skip the reload.
+        With ``proxy=None`` proxies are only used once the host blocked the
+        attempt or is known to block direct connections; True and False force
+        them on or off.
+        """
+        failure = self.failures.get(url)
+        blocked = failure is not None and failure.blocked
+        if proxy is None:
+            proxy = blocked or get_connection_policy(url).needs_proxy()
+
+        if failure is None:
+            return await self.next_proxy() if proxy else ''
+
+        step = RETRY_LADDER[min(failure.count, len(RETRY_LADDER)) - 1]
+        if step == RELOAD and not blocked:
+            logger.info(f"Retrying {url} in the same context")
+            return failure.proxy
+
+        slot = self.contexts.get(failure.proxy)
+        if slot is not None:
+            await self.retire_context(slot)
+
+        if step == NEW_BROWSER:
+            logger.info(f"Retrying {url} in a new browser")
+            self.restart_requested = True
+        else:
+            logger.info(f"Retrying {url} in a new context{' through a proxy' if proxy else ''}")
+
+        return await self.next_proxy() if proxy else ''
+
+    def check_memory(self) -> None:
+        """Sample the browser's process-tree RSS and schedule a recycle once it outgrows its envelope.
+
+        Above ``CONTEXT_RECYCLE_RSS_RATIO`` of the limit every context is
+        recycled on its next use, which frees its renderers; above the limit
+        the whole browser is restarted. Both wait for in-flight pages to drain.
+        """
+        if self.managed_browser is None or self.pages_scraped % self.sample_rss_every:
+            return
+
+        rss = self.managed_browser.rss()
+        self.peak_rss = max(self.peak_rss, rss)
+        if rss >= self.max_browser_rss:
+            if not self.restart_requested:
+                logger.warning(
+                    f"Browser using {rss / 1024 / 1024:.0f} MB, restarting once in-flight pages drain")
+                self.restart_requested = True
+                self.n_memory_recycles += 1
+        elif rss >= self.max_browser_rss * CONTEXT_RECYCLE_RSS_RATIO:
+            slots = [slot for slot in self.contexts.values() if not slot.recycle_requested]
+            if slots:
+                logger.info(
+                    f"Browser using {rss / 1024 / 1024:.0f} MB, recycling {len(slots)} context(s)")
+                for slot in slots:
+                    slot.recycle_requested = True
+                self.n_memory_recycles += 1
+
+    async def wait_for_drain(self) -> None:
+        """Wait until every in-flight page of the current browser is released"""
+        while self.pages_in_flight > 0:
+            await asyncio.sleep(0.1)
+
+    async def setup_browser(self, browser_type: str = "firefox") -> None:
+        """Initialize browser with enhanced configuration, reusing the running one if possible.
+
+        Proxies are bound per context, so one browser process serves every
+        proxy identity and rotating a proxy never relaunches it.
+        """
+        if not self.needs_restart(browser_type):
+            return
+
+        if self.managed_browser is not None:
+            await self.wait_for_drain()
+            logger.info(
+                f"Recycling browser after {self.pages_since_restart} page(s)")
+            await self.close()
 
-        # Get proxy
-        proxy_settings = {"proxy": {"server": proxy}} if proxy else {}
+        self.browser = None
+        host = self.first_party or "default"
 
         # Enhanced browser arguments
         stealth_args = [
@@ -118,7 +399,9 @@ class WebScraper:
         ]
 
         if browser_type == "firefox":
-            self.browser = await self.playwright_instance.firefox.launch(
+            self.managed_browser = await get_browser_manager().launch(
+                host,
+                "firefox",
                 headless=True,
                 args=stealth_args + ["--no-remote"],
                 firefox_user_prefs={
@@ -143,56 +426,139 @@ class WebScraper:
                     "network.http.pipelining": True,
                     "network.http.pipelining.maxrequests": 8,
                     "network.http.max-connections": 32,
-                },
-                **proxy_settings
+                }
             )
         else:
-            self.browser = await self.playwright_instance.chromium.launch(
+            chromium_args = [
+                "--disable-blink-features=AutomationControlled",
+                "--disable-infobars",
+                "--disable-notifications",
+            ]
+            if "image" in self.resource_policy.block_types:
+                # Let Blink skip images instead of aborting each one in the route handler
+                chromium_args.append("--blink-settings=imagesEnabled=false")
+
+            self.managed_browser = await get_browser_manager().launch(
+                host,
+                "chromium",
                 headless=True,
-                args=stealth_args + [
-                    "--disable-blink-features=AutomationControlled",
-                    "--disable-infobars",
-                    "--disable-notifications",
-                ],
-                **proxy_settings
+                args=stealth_args + chromium_args
             )
 
-        if self.context is None:
-            context_options = {
-                "locale": random.choice(["en-US", "en-GB", "en-CA"]),
-                "user_agent": self.ua.random,
-                "viewport": {"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},
-                "java_script_enabled": True,
-                "ignore_https_errors": True,
-                "extra_http_headers": self.get_headers(),
-                "timezone_id": random.choice(["America/New_York", "Europe/London", "America/Los_Angeles"]),
-                "permissions": [],  # Minimize permissions
-            }
+        self.browser = self.managed_browser.browser
+        self.current_browser_type = browser_type
+        self.pages_since_restart = 0
+        self.restart_requested = False
 
-            self.context = await self.browser.new_context(**context_options)
+    async def get_context(self, proxy: str) -> ContextSlot:
+        """Context bound to the proxy, created in the running browser on first use or once recycled"""
+        slot = self.contexts.get(proxy)
+        if slot is not None and slot.pages_served < self.recycle_context_every \
+                and not slot.recycle_requested:
+            return slot
 
-            # Enhanced request interception
-            await self.context.route("**/*", self._route_handler)
+        if slot is not None:
+            reason = "memory pressure" if slot.recycle_requested else f"{slot.pages_served} page(s)"
+            logger.info(f"Recycling context after {reason}")
+            await self.retire_context(slot)
 
-    async def _route_handler(self, route):
-        """Enhanced route handler for blocking unwanted resources"""
-        url = route.request.url
-        resource_type = route.request.resource_type
-
-        # Block unwanted resources
-        block_patterns = [
-            'analytics', 'ads', 'tracking', 'metrics', 'telemetry',
-            'facebook.com', 'google-analytics', 'googletagmanager',
-            'doubleclick.net', 'adsystem.com', 'amazon-adsystem.com'
-        ]
+        logger.info(f"Using proxy {proxy}")
+        context_options = {
+            "locale": random.choice(["en-US", "en-GB", "en-CA"]),
+            "user_agent": self.ua.random,
+            "viewport": {"width": random.randint(1366, 1920), "height": random.randint(768, 1080)},
+            "java_script_enabled": self.resource_policy.javascript,
+            "ignore_https_errors": True,
+            "extra_http_headers": self.get_headers(),
+            "timezone_id": random.choice(["America/New_York", "Europe/London", "America/Los_Angeles"]),
+            "permissions": [],  # Minimize permissions
+        }
+        if proxy:
+            context_options["proxy"] = {"server": proxy}
+
+        context = await self.browser.new_context(**context_options)
+
+        # Enhanced request interception
+        if self.resource_policy.needs_routing:
+            await context.route("**/*", self._route_handler)
+        context.on("response", self._record_response)
 
-        block_types = ['image', 'media', 'font', 'other']
+        slot = ContextSlot(context, proxy)
+        self.contexts[proxy] = slot
+        if proxy in self.pending_proxies:
+            self.pending_proxies.remove(proxy)
+        return slot
 
-        if any(pattern in url.lower() for pattern in block_patterns) or resource_type in block_types:
+    async def retire_context(self, slot: ContextSlot) -> None:
+        """Stop handing out the context and close it once its last page is released"""
+        if self.contexts.get(slot.proxy) is slot:
+            del self.contexts[slot.proxy]
+
+        if slot.retired:
+            return
+        slot.retired = True
+
+        if slot.pages_in_flight == 0:
+            await self._close_context(slot)
+        else:
+            self.retired_contexts.append(slot)
+
+    async def _close_context(self, slot: ContextSlot) -> None:
+        slot.idle_pages = []
+        if slot in self.retired_contexts:
+            self.retired_contexts.remove(slot)
+
+        try:
+            await slot.context.close()
+        except Exception as e:
+            logger.error(f"Error closing context: {e}")
+
+    async def acquire_page(self, slot: ContextSlot) -> Page:
+        """Reuse an idle page of the context or open a new one"""
+        slot.pages_in_flight += 1
+        while slot.idle_pages:
+            page = slot.idle_pages.pop()
+            if not page.is_closed():
+                return page
+
+        try:
+            return await slot.context.new_page()
+        except Exception:
+            slot.pages_in_flight -= 1
+            raise
+
+    async def release_page(self, slot: ContextSlot, page: Page, reusable: bool = True) -> None:
+        """Return a page to its context's idle pool, or close it if it cannot be reused"""
+        slot.pages_in_flight -= 1
+
+        if reusable and not slot.retired and not page.is_closed():
+            slot.idle_pages.append(page)
+            return
+
+        try:
+            await page.close()
+        except Exception as e:
+            logger.error(f"Error closing page: {e}")
+
+        if slot.retired and slot.pages_in_flight == 0:
+            await self._close_context(slot)
+
+    async def _route_handler(self, route):
+        """Block the resources the shop's resource policy does not need"""
+        request = route.request
+        blocked = self.resource_policy.should_block(
+            request.url, request.resource_type, self.first_party)
+        self.resource_policy.record(request.resource_type, blocked)
+
+        if blocked:
             await route.abort()
         else:
             await route.continue_()
 
+    def _record_response(self, response) -> None:
+        self.resource_policy.stats.record_response(
+            response.request.resource_type, response.headers.get("content-length"))
+
     async def simulate_human_behavior(self, page: Page, url: str):
         """Enhanced human behavior simulation"""
         # Random delay
@@ -220,52 +586,101 @@ class WebScraper:
             except Exception:
                 pass  # Ignore click errors
 
-    async def _extract_scrape_content(
+    @asynccontextmanager
+    async def navigate(
         self,
         url: str,
-        selector: str,
         proxy: str,
         timeout: int = REQUEST_TIMEOUT,
         wait_until: str = "domcontentloaded",
-        simulate_behavior: bool = True,
         headers: Optional[Dict[str, str]] = None,
         browser: str = 'firefox',
-
-    ) -> BeautifulSoup:
-
+        on_response: Optional[Callable[[Response], Any]] = None
+    ):
+        """Open a pooled page on ``url`` and yield it, paced and recycled like every scrape.
+
+        Failures inside the block are raised as ScrapingError and recorded
+        for ``plan_attempt`` to escalate the retry. Blocked attempts retire
+        the context and keep the page out of the pool right away; other
+        failures leave both in place for a cheap reload.
+        """
+        slot = None
         page = None
+        succeeded = False
+        gone = False
+        blocked = False
+        limiter = get_limiter(url)
         try:
-            await self.setup_browser(proxy, browser)
+            await limiter.wait()
 
-            if not self.context:
-                raise ScrapingError("Failed to initialize browser context")
+            # Concurrent tabs share one browser; only one of them may (re)launch it
+            async with self._browser_lock:
+                await self.setup_browser(browser)
 
-            page = await self.context.new_page()
+                if not self.browser:
+                    raise ScrapingError("Failed to initialize browser")
+
+                slot = await self.get_context(proxy or '')
+                page = await self.acquire_page(slot)
+            # Timeouts follow the host's observed latency, capped by the defaults
+            latency = get_latency(url)
+            navigation_timeout = latency.timeout(NAVIGATION, PAGE_LOAD_TIMEOUT)
             page.set_default_timeout(timeout)
-            page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
+            page.set_default_navigation_timeout(navigation_timeout)
 
             # Set additional headers if provided
             if headers:
                 await page.set_extra_http_headers(self.get_headers(headers))
 
-            logger.info(f"Navigating to: {url}")
-            await page.goto(url, wait_until=wait_until, timeout=PAGE_LOAD_TIMEOUT)
-
-            logger.info(f"Waiting for selector: {selector}")
-            await page.wait_for_selector(selector, timeout=timeout)
+            if on_response:
+                page.on("response", on_response)
 
-            # Extract content
-            logger.info("Extracting page content...")
-            rendered_html = await page.content()
-            soup = BeautifulSoup(rendered_html, "html.parser")
+            logger.info(f"Navigating to: {url}")
+            started = time.monotonic()
+            response = await page.goto(url, wait_until=wait_until, timeout=navigation_timeout)
+            elapsed_ms = (time.monotonic() - started) * 1000
+
+            if response is not None:
+                limiter.record_status(
+                    response.status, response.headers.get("retry-after"))
+                if response.status in THROTTLE_STATUS_CODES:
+                    raise BlockedError(
+                        f"Throttled by {url}: HTTP {response.status}")
+                if response.status in BLOCKED_STATUS_CODES:
+                    raise BlockedError(
+                        f"Blocked by {url}: HTTP {response.status}")
+                if response.status in GONE_STATUS_CODES:
+                    raise SkipScrape(f"{url} returned HTTP {response.status}")
+
+            # Fast refusals and error pages would pull the timeouts down
+            latency.record(NAVIGATION, elapsed_ms)
+
+            yield page
 
             self.pages_scraped += 1
-            logger.success(
-                f"Successfully extracted content from {url}")
-
-            return soup
-
-        except asyncio.TimeoutError as e:
+            self.pages_since_restart += 1
+            slot.pages_served += 1
+            succeeded = True
+            self.check_memory()
+            self.failures.pop(url, None)
+            get_connection_policy(url).record(proxy, blocked=False)
+
+        except SkipScrape:
+            # The identity worked, only the page is gone
+            gone = True
+            self.failures.pop(url, None)
+            raise
+
+        except BlockedError:
+            blocked = True
+            get_connection_policy(url).record(proxy, blocked=True)
+            raise
+
+        except ScrapingError:
+            raise
+
+        except (asyncio.TimeoutError, PlaywrightTimeoutError) as e:
+            limiter.record_failure()
             raise ScrapingError(f"Timeout for {url}: {e}")
 
         except Exception as e:
@@ -273,67 +688,387 @@ class WebScraper:
 
         finally:
             if page:
+                if on_response:
+                    page.remove_listener("response", on_response)
+                # Pages with custom headers are not reused to avoid leaking them
+                await self.release_page(slot, page, reusable=not blocked and not headers)
+
+            if not succeeded and not gone:
+                previous = self.failures.get(url)
+                self.failures[url] = FailedAttempts(
+                    previous.count + 1 if previous else 1, blocked, proxy or '')
+                if blocked and slot is not None:
+                    # A refused identity is no use to any other page either
+                    await self.retire_context(slot)
+
+            if slot is None and proxy in self.pending_proxies:
+                self.pending_proxies.remove(proxy)
+
+    async def _extract_scrape_content(
+        self,
+        url: str,
+        selector: str,
+        proxy: str,
+        timeout: int = REQUEST_TIMEOUT,
+        wait_until: str = "domcontentloaded",
+        simulate_behavior: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        browser: str = 'firefox',
+        parse_only: Optional[SoupStrainer] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+        keep_selectors: Optional[Tuple[str, ...]] = None
+
+    ) -> BeautifulSoup:
+
+        cache = get_fetch_cache()
+        cache_options = {"selector": selector, "wait_until": wait_until,
+                         "browser": browser, "headers": headers}
+        if keep_selectors is not None:
+            cache_options["keep_selectors"] = list(keep_selectors)
+        cached = cache.get(url, **cache_options)
+        if cached is not None:
+            logger.info(f"Using cached content for {url}")
+            return parse(cached["html"]) if parse else make_soup(cached["html"], parse_only)
+
+        async with self.navigate(url, proxy, timeout, wait_until, headers, browser) as page:
+            await self.wait_for_product(page, url, selector, timeout)
+
+            # Extract content
+            logger.info("Extracting page content...")
+            rendered_html = await self.get_content(page, selector, keep_selectors)
+            soup = parse(rendered_html) if parse else make_soup(
+                rendered_html, parse_only)
+            cache.set(url, {"html": rendered_html}, **cache_options)
+
+        logger.success(
+            f"Successfully extracted content from {url}")
+
+        return soup
+
+    async def wait_for_product(self, page: Page, url: str, selector: str, timeout: int) -> None:
+        """Race the selector against the other outcomes a page can settle on.
+
+        A bot challenge raises ScrapingError, so the retry starts from a fresh
+        context; a not-found page or an empty listing (checked only while
+        ``empty_listing_texts`` is set) raises SkipScrape; a consent wall
+        hiding the content is accepted once and the race goes on.
+        Only a page showing none of them waits out the timeout.
+        """
+        latency = get_latency(url)
+        timeout = latency.timeout(SELECTOR, timeout)
+        logger.info(f"Waiting for selector: {selector} ({timeout} ms)")
+        started = time.monotonic()
+        deadline = started + timeout / 1000
+        consent_selectors = list(CONSENT_ACCEPT_SELECTORS)
+
+        while True:
+            handle = await page.wait_for_function(
+                OUTCOME_SCRIPT,
+                arg=[selector, list(CHALLENGE_SELECTORS), list(CHALLENGE_TITLES),
+                     list(self.unavailable_markers), consent_selectors, list(self.empty_listing_texts)],
+                polling=OUTCOME_POLLING,
+                timeout=max(1, (deadline - time.monotonic()) * 1000)
+            )
+            outcome = await handle.json_value()
+
+            if outcome == "success":
+                if selector:
+                    latency.record(SELECTOR, (time.monotonic() - started) * 1000)
+                return
+
+            if outcome == "challenge":
+                raise BlockedError(f"Bot challenge served by {url}")
+
+            if outcome == "not_found":
+                raise SkipScrape(f"{url} is unavailable")
+
+            if outcome == "empty":
+                raise SkipScrape(f"{url} lists no products")
+
+            logger.info(f"Accepting consent wall on {url}")
+            for consent_selector in consent_selectors:
+                button = await page.query_selector(consent_selector)
+                if button is None:
+                    continue
                 try:
-                    await page.close()
+                    await button.click(timeout=2000)
                 except Exception as e:
-                    logger.error(f"Error closing page: {e}")
+                    logger.warning(f"Could not accept consent wall on {url}: {e}")
+                break
+            # Race on without it, whether or not the click worked
+            consent_selectors = []
+
+    async def get_content(self, page: Page, selector: str, keep_selectors: Optional[Tuple[str, ...]] = None) -> str:
+        """HTML of the whole page, or with ``keep_selectors`` only the selector's
+        outerHTML plus the nodes they match, so the rest is never serialized"""
+        if keep_selectors is None or not selector:
+            return await page.content()
+
+        return await page.evaluate(SCOPED_CONTENT_SCRIPT, [selector, list(keep_selectors)])
+
+    async def _capture_json_responses(
+        self,
+        url: str,
+        patterns: List[str],
+        proxy: str,
+        selector: Optional[str] = None,
+        timeout: int = REQUEST_TIMEOUT,
+        wait_until: str = "domcontentloaded",
+        headers: Optional[Dict[str, str]] = None,
+        browser: str = 'firefox',
+        min_responses: int = 1
+
+    ) -> List[CapturedResponse]:
+
+        matcher = re.compile("|".join(re.escape(pattern)
+                             for pattern in patterns), re.IGNORECASE)
+        captured: List[CapturedResponse] = []
+        reads: List[asyncio.Task] = []
+
+        async def read_json(response: Response):
+            try:
+                captured.append(CapturedResponse(
+                    response.url, response.status, await response.json()))
+                logger.info(f"Captured JSON from: {response.url}")
+            except Exception as e:
+                logger.warning(f"Failed to parse JSON from {response.url}: {e}")
+
+        def on_response(response: Response):
+            if response.ok and matcher.search(response.url) \
+                    and "json" in response.headers.get("content-type", ""):
+                reads.append(asyncio.ensure_future(read_json(response)))
+
+        async with self.navigate(url, proxy, timeout, wait_until, headers, browser, on_response) as page:
+            if selector:
+                await self.wait_for_product(page, url, selector, timeout)
+
+            # Front ends often fire their API calls after the load event
+            deadline = time.monotonic() + CAPTURE_TIMEOUT / 1000
+            while len(captured) < min_responses and time.monotonic() < deadline:
+                await asyncio.sleep(0.1)
+            await asyncio.gather(*reads)
+
+            if len(captured) < min_responses:
+                raise ScrapingError(
+                    f"Captured {len(captured)} of {min_responses} JSON response(s) from {url}")
+
+        return captured
+
+    async def _evaluate_page(
+        self,
+        url: str,
+        selector: str,
+        script: str,
+        proxy: str,
+        timeout: int = REQUEST_TIMEOUT,
+        wait_until: str = "domcontentloaded",
+        headers: Optional[Dict[str, str]] = None,
+        browser: str = 'firefox',
+        with_html: bool = False
+
+    ) -> EvaluatedPage:
+
+        cache = get_fetch_cache()
+        cache_options = {"selector": selector, "wait_until": wait_until,
+                         "browser": browser, "headers": headers, "script": script}
+        cached = cache.get(url, **cache_options)
+        if cached is not None and (cached["html"] is not None or not with_html):
+            logger.info(f"Using cached evaluation for {url}")
+            return EvaluatedPage(url, cached["data"], cached["html"])
+
+        async with self.navigate(url, proxy, timeout, wait_until, headers, browser) as page:
+            await self.wait_for_product(page, url, selector, timeout)
+
+            logger.info("Running extraction script...")
+            data = await page.evaluate(script)
+            html = await page.content() if with_html else None
+            cache.set(url, {"data": data, "html": html}, **cache_options)
+
+        logger.success(f"Successfully evaluated {url}")
+
+        return EvaluatedPage(url, data, html)
 
     async def extract_scrape_content(
         self,
         url: str,
         selector: str,
-        proxy: bool,
+        proxy: Optional[bool],
         timeout: int = REQUEST_TIMEOUT,
         wait_until: str = "domcontentloaded",
         simulate_behavior: bool = True,
         headers: Optional[Dict[str, str]] = None,
-        browser: str = "firefox"
+        browser: str = "firefox",
+        parse_only: Optional[SoupStrainer] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+        keep_selectors: Optional[Tuple[str, ...]] = None
 
     ) -> Optional[BeautifulSoup]:
 
+        get_breaker(url).record_request()
         try:
             return await retry_extract_scrape_content(
-                self, url, selector, proxy, timeout, wait_until, simulate_behavior, headers, browser
+                self, url, selector, proxy, timeout, wait_until, simulate_behavior, headers, browser, parse_only, parse, keep_selectors
             )
+        except CircuitOpenError:
+            raise
         except SkipScrape as e:
             logger.warning(f"Skipping scrape: {e}")
+            self.skipped[url] = str(e)
             return None
         except Exception as e:
             logger.error(f"Failed to scrape after {MAX_RETRIES} attempts: {e}")
             return None
+        finally:
+            self.failures.pop(url, None)
 
-    async def close(self):
-        """Close only browser resources, keep proxy rotator"""
+    async def capture_json(
+        self,
+        url: str,
+        patterns: List[str],
+        proxy: Optional[bool],
+        selector: Optional[str] = None,
+        timeout: int = REQUEST_TIMEOUT,
+        wait_until: str = "domcontentloaded",
+        headers: Optional[Dict[str, str]] = None,
+        browser: str = "firefox",
+        min_responses: int = 1
+
+    ) -> List[CapturedResponse]:
+
+        get_breaker(url).record_request()
         try:
-            if self.context:
-                await self.context.close()
-                self.context = None
+            return await retry_capture_json_responses(
+                self, url, patterns, proxy, selector, timeout, wait_until, headers, browser, min_responses
+            )
+        except CircuitOpenError:
+            raise
+        except SkipScrape as e:
+            logger.warning(f"Skipping capture: {e}")
+            self.skipped[url] = str(e)
+            return []
+        except Exception as e:
+            logger.error(f"Failed to capture after {MAX_RETRIES} attempts: {e}")
+            return []
+        finally:
+            self.failures.pop(url, None)
 
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
+    async def evaluate(
+        self,
+        url: str,
+        selector: str,
+        script: str,
+        proxy: Optional[bool],
+        timeout: int = REQUEST_TIMEOUT,
+        wait_until: str = "domcontentloaded",
+        headers: Optional[Dict[str, str]] = None,
+        browser: str = "firefox",
+        with_html: bool = False
 
-            if self.playwright_instance:
-                await self.playwright_instance.stop()
-                self.playwright_instance = None
+    ) -> Optional[EvaluatedPage]:
 
-            logger.info("Browser resources closed")
+        get_breaker(url).record_request()
+        try:
+            return await retry_evaluate_page(
+                self, url, selector, script, proxy, timeout, wait_until, headers, browser, with_html
+            )
+        except CircuitOpenError:
+            raise
+        except SkipScrape as e:
+            logger.warning(f"Skipping evaluation: {e}")
+            self.skipped[url] = str(e)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to evaluate after {MAX_RETRIES} attempts: {e}")
+            return None
+        finally:
+            self.failures.pop(url, None)
+
+    async def close(self):
+        """Close only browser resources, keep proxy rotator"""
+        self.contexts = {}
+        self.retired_contexts = []
+        self.pending_proxies = []
+        self.current_browser_type = None
+        try:
+            # The manager also kills any process the browser leaves behind
+            if self.managed_browser:
+                await get_browser_manager().release(self.managed_browser)
+                self.managed_browser = None
+            self.browser = None
+
+            logger.info(
+                f"Browser resources closed (peak RSS {self.peak_rss / 1024 / 1024:.0f} MB, "
+                f"{self.n_memory_recycles} memory recycle(s))")
 
         except Exception as e:
             logger.error(f"Error during browser close: {e}")
 
 
+def retry_within_budget(retry_state) -> bool:
+    """Retry scraping errors while the host's retry budget allows it"""
+    url = retry_state.args[1]
+    return retry_if_exception_type(ScrapingError)(retry_state) \
+        and retry_state.attempt_number < MAX_RETRIES and get_breaker(url).allow_retry()
+
+
+@asynccontextmanager
+async def guarded_attempt(url: str):
+    """Run one scrape attempt through the host's circuit breaker, waiting while it is open"""
+    breaker = get_breaker(url)
+    await breaker.before_attempt()
+    try:
+        yield
+    except SkipScrape:
+        # The host answered, the page just does not exist
+        breaker.record_success()
+        raise
+    except BaseException:
+        breaker.record_failure()
+        raise
+
+    breaker.record_success()
+
+
 @retry(
     wait=wait_exponential(
         multiplier=1, min=MIN_WAIT_BETWEEN_REQ, max=MAX_WAIT_BETWEEN_REQ),
     stop=stop_after_attempt(MAX_RETRIES),
-    retry=retry_if_exception_type(ScrapingError),
+    retry=retry_within_budget,
     before_sleep=before_sleep_log(logger, "WARNING"),
     reraise=True,
 )
-async def retry_extract_scrape_content(scraper, url, selector, proxy, timeout, wait_until, simulate_behavior, headers, browser):
-    generate_proxy = await ProxyRotator().get_proxy() if proxy == True else ''
-    return await scraper._extract_scrape_content(url, selector, generate_proxy, timeout, wait_until, simulate_behavior, headers, browser)
+async def retry_extract_scrape_content(scraper, url, selector, proxy, timeout, wait_until, simulate_behavior, headers, browser, parse_only=None, parse=None, keep_selectors=None):
+    async with guarded_attempt(url):
+        generate_proxy = await scraper.plan_attempt(url, proxy)
+        return await scraper._extract_scrape_content(url, selector, generate_proxy, timeout, wait_until, simulate_behavior, headers, browser, parse_only, parse, keep_selectors)
+
+
+@retry(
+    wait=wait_exponential(
+        multiplier=1, min=MIN_WAIT_BETWEEN_REQ, max=MAX_WAIT_BETWEEN_REQ),
+    stop=stop_after_attempt(MAX_RETRIES),
+    retry=retry_within_budget,
+    before_sleep=before_sleep_log(logger, "WARNING"),
+    reraise=True,
+)
+async def retry_capture_json_responses(scraper, url, patterns, proxy, selector, timeout, wait_until, headers, browser, min_responses):
+    async with guarded_attempt(url):
+        generate_proxy = await scraper.plan_attempt(url, proxy)
+        return await scraper._capture_json_responses(url, patterns, generate_proxy, selector, timeout, wait_until, headers, browser, min_responses)
+
+
+@retry(
+    wait=wait_exponential(
+        multiplier=1, min=MIN_WAIT_BETWEEN_REQ, max=MAX_WAIT_BETWEEN_REQ),
+    stop=stop_after_attempt(MAX_RETRIES),
+    retry=retry_within_budget,
+    before_sleep=before_sleep_log(logger, "WARNING"),
+    reraise=True,
+)
+async def retry_evaluate_page(scraper, url, selector, script, proxy, timeout, wait_until, headers, browser, with_html):
+    async with guarded_attempt(url):
+        generate_proxy = await scraper.plan_attempt(url, proxy)
+        return await scraper._evaluate_page(url, selector, script, generate_proxy, timeout, wait_until, headers, browser, with_html)
 
 
 class AsyncWebScraper:
@@ -351,32 +1086,126 @@ class AsyncWebScraper:
 async def scrape_url(
     url: str,
     selector: str,
-    proxy: bool,
+    proxy: Optional[bool],
     headers: Optional[Dict[str, str]] = None,
     wait_until: str = "domcontentloaded",
     min_sec: float = 2,
     max_sec: float = 5,
-    browser: str = 'firefox'
+    browser: str = 'firefox',
+    scraper: Optional[WebScraper] = None,
+    parse_only: Optional[SoupStrainer] = None,
+    parse: Optional[Callable[[str], Any]] = None,
+    keep_selectors: Optional[Tuple[str, ...]] = None
 ) -> Optional[BeautifulSoup]:
-    """Scrape a single URL with enhanced error handling"""
-    async with AsyncWebScraper() as scraper:
-        result = await scraper.extract_scrape_content(
-            url, selector, proxy, headers=headers, wait_until=wait_until, browser=browser
-        )
-
-        # Smart delay based on success
-        if result is not None:
-            delay = random.uniform(min_sec, max_sec)
-        else:
-            # Longer delay on failure
-            delay = random.uniform(max_sec, max_sec * 2)
+    """Scrape a single URL with enhanced error handling.
+
+    When a long-lived ``scraper`` is given its browser and pages are reused,
+    otherwise a one-off browser is launched and closed for this URL only.
+    Pacing is left to the host's rate limiter, which adapts between
+    ``min_sec`` and ``max_sec`` seconds per request while the host is healthy.
+    ``parse_only`` limits parsing of the rendered page to the strained tags,
+    while ``parse`` replaces the soup with its own result, e.g. structured data.
+    With ``keep_selectors`` the browser only returns the selector's element and
+    the nodes matched by them instead of serializing the whole document.
+    """
+    get_limiter(url, min_sec, max_sec)
+
+    if scraper is None:
+        async with AsyncWebScraper() as one_off_scraper:
+            return await one_off_scraper.extract_scrape_content(
+                url, selector, proxy, headers=headers, wait_until=wait_until, browser=browser, parse_only=parse_only, parse=parse, keep_selectors=keep_selectors
+            )
+
+    return await scraper.extract_scrape_content(
+        url, selector, proxy, headers=headers, wait_until=wait_until, browser=browser, parse_only=parse_only, parse=parse, keep_selectors=keep_selectors
+    )
+
+
+async def capture_url(
+    url: str,
+    patterns: List[str],
+    proxy: Optional[bool],
+    selector: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+    wait_until: str = "domcontentloaded",
+    min_sec: float = 2,
+    max_sec: float = 5,
+    browser: str = 'firefox',
+    scraper: Optional[WebScraper] = None,
+    min_responses: int = 1
+) -> List[CapturedResponse]:
+    """Load a URL and collect the JSON responses whose URL contains one of ``patterns``.
+
+    The selector is only awaited if given, so API-driven pages can return as
+    soon as ``min_responses`` payloads arrived. Browser reuse and pacing work
+    as in ``scrape_url``.
+    """
+    get_limiter(url, min_sec, max_sec)
+
+    if scraper is None:
+        async with AsyncWebScraper() as one_off_scraper:
+            return await one_off_scraper.capture_json(
+                url, patterns, proxy, selector, headers=headers, wait_until=wait_until, browser=browser, min_responses=min_responses
+            )
+
+    return await scraper.capture_json(
+        url, patterns, proxy, selector, headers=headers, wait_until=wait_until, browser=browser, min_responses=min_responses
+    )
 
-        if delay >= 60:
-            minutes = int(delay // 60)
-            seconds = delay % 60
-            logger.info(f"Sleep for {minutes} min {seconds:.2f} sec")
-        else:
-            logger.info(f"Sleep for {delay:.2f} sec")
 
-        await asyncio.sleep(delay)
-        return result
+async def evaluate_url(
+    url: str,
+    selector: str,
+    script: str,
+    proxy: Optional[bool],
+    headers: Optional[Dict[str, str]] = None,
+    wait_until: str = "domcontentloaded",
+    min_sec: float = 2,
+    max_sec: float = 5,
+    browser: str = 'firefox',
+    scraper: Optional[WebScraper] = None,
+    with_html: bool = False
+) -> Optional[EvaluatedPage]:
+    """Load a URL, wait for the selector and return what ``script`` evaluates to in the page.
+
+    The page is never serialized unless ``with_html`` asks for its HTML as
+    well. Browser reuse and pacing work as in ``scrape_url``.
+    """
+    get_limiter(url, min_sec, max_sec)
+
+    if scraper is None:
+        async with AsyncWebScraper() as one_off_scraper:
+            return await one_off_scraper.evaluate(
+                url, selector, script, proxy, headers=headers, wait_until=wait_until, browser=browser, with_html=with_html
+            )
+
+    return await scraper.evaluate(
+        url, selector, script, proxy, headers=headers, wait_until=wait_until, browser=browser, with_html=with_html
+    )
+
+
+async def paced_goto(
+    page: Page,
+    url: str,
+    min_sec: Optional[float] = None,
+    max_sec: Optional[float] = None,
+    **options
+) -> Optional[Response]:
+    """``page.goto`` for pages a shop drives itself, paced and fed back to the host's limiter.
+
+    Waits for the host's rate limiter like ``navigate`` does and reports
+    the response status (429/503 back the host off) and timeouts to it.
+    """
+    limiter = get_limiter(url, min_sec, max_sec)
+    await limiter.wait()
+
+    try:
+        response = await page.goto(url, **options)
+    except (asyncio.TimeoutError, PlaywrightTimeoutError):
+        limiter.record_failure()
+        raise
+
+    if response is not None:
+        limiter.record_status(
+            response.status, response.headers.get("retry-after"))
+    return response
@@ -15,6 +15,7 @@ class AsdaETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'main.layout__main'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.extraction_script = 'asdagroceries.js'
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
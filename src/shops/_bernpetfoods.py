@@ -1,12 +1,12 @@
 import re
 import json
-import requests
 import asyncio
 import math
 import pandas as pd
 
 from bs4 import BeautifulSoup
 from ..etl import PetProductsETL
+from ..ratings import get_ratings_service, feefo_summary
 from loguru import logger
 
 
@@ -18,6 +18,8 @@ class BernPetFoodsETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#primary'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.rating_source = feefo_summary(
+            "bern-pet-foods", "www.bernpetfoods.co.uk")
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
@@ -48,6 +50,9 @@ class BernPetFoodsETL(PetProductsETL):
             return df
 
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find(
                 'h1', class_="product_title").get_text(strip=True)
@@ -58,10 +63,8 @@ class BernPetFoodsETL(PetProductsETL):
             product_id = re.search(
                 r'postid-(\d+)', ' '.join(soup.body['class'])).group(0)
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=bern-pet-foods&origin=www.bernpetfoods.co.uk")
-            rating = int(rating_wrapper.json()['rating']['rating'])
-            product_rating = f'{rating}/5'
+            rating = await get_ratings_service().get_rating(self.rating_source, product_id)
+            product_rating = f'{int(rating or 0)}/5'
 
             variants = []
             prices = []
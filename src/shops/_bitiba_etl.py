@@ -1,13 +1,11 @@
 import re
-import json
 import math
-import time
-import random
 import pandas as pd
-import requests
 
 from ..etl import PetProductsETL
-from bs4 import BeautifulSoup
+from ..http_client import conditional_get, remember_validators
+from ..structured_data import StructuredPage, LD_JSON, META
+from ..resource_policy import LEAN_POLICY
 from loguru import logger
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type, before_sleep_log
 MIN_WAIT_BETWEEN_REQ = 10
@@ -28,6 +26,8 @@ class BitibaETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
         self.with_proxy = False
+        self.structured_data_blocks = (LD_JSON, META)
+        self.resource_policy = LEAN_POLICY
 
     @retry(
         wait=wait_exponential(
@@ -38,15 +38,19 @@ class BitibaETL(PetProductsETL):
         reraise=True,
     )
     def _fetch_json_with_retry(self, url):
-        response = requests.get(url)
+        response = conditional_get(
+            url, min_interval=MIN_WAIT_BETWEEN_REQ, max_interval=MAX_WAIT_BETWEEN_REQ)
         if response.status_code != 200:
             raise ScrapingError(
                 f"Failed to fetch: {url} | Status: {response.status_code}")
         try:
-            return response.json()
+            data = response.json()
         except Exception as e:
             raise ScrapingError(f"Failed to parse JSON from {url}: {e}")
 
+        remember_validators(url, response)
+        return data
+
     def extract(self, category):
         urls = []
         base_api_url = (
@@ -97,8 +101,6 @@ class BitibaETL(PetProductsETL):
         logger.info(
             f"Found {n_products} products across {n_pagination} pages.")
 
-        time.sleep(random.uniform(10, 15))
-
         for page in range(1, n_pagination + 1):
             page_url = build_url(page)
             logger.info(f"Accessing page {page}: {page_url}")
@@ -116,17 +118,14 @@ class BitibaETL(PetProductsETL):
                 logger.warning(f"Skipping page {page}: {str(e)}")
                 continue
 
-            time.sleep(random.uniform(10, 15))
-
         df = pd.DataFrame({"url": urls})
         df.insert(0, "shop", self.SHOP)
         logger.info(f"Total extracted URLs: {len(df)}")
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    def transform(self, page: StructuredPage, url: str):
         try:
-            product_data = json.loads(soup.select(
-                "script[type*='application/ld+json']")[1].text)
+            product_data = page.find_ld_json("hasVariant")
             product_title = product_data["name"]
             description = product_data["description"]
             rating = '0/5'
@@ -146,8 +145,7 @@ class BitibaETL(PetProductsETL):
             for variant in product_data['hasVariant']:
                 variants.append(variant['name'].replace(
                     product_title, '').strip())
-                image_urls.append(
-                    soup.find('meta', attrs={'property': "og:image"}).get('content'))
+                image_urls.append(page.meta["og:image"])
                 price = 0
                 discount_price = 0
                 discount_percentage = 0
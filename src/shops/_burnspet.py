@@ -1,7 +1,7 @@
 import asyncio
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from ..ratings import get_ratings_service, trustpilot_trustbox, format_rating
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -48,6 +48,9 @@ class BurnsPetETL(PetProductsETL):
             return df
 
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             if soup.find(string="Out of stock"):
                 logger.info(f"Skipping {url} as it is sold out. ")
@@ -69,18 +72,9 @@ class BurnsPetETL(PetProductsETL):
                 locale = rating_wrapper.get("data-locale", "en-GB")
                 sku = rating_wrapper.get("data-sku", "")
 
-                sku_encoded = "%2C".join(sku.split(",")) if sku else ""
-
-                get_rating_details = requests.get(
-                    f"https://widget.trustpilot.com/trustbox-data/{template_id}?businessUnitId={business_unit_id}&locale={locale}&sku={sku_encoded}")
-                if get_rating_details.status_code == 200:
-                    if get_rating_details.json()["productReviewsSummary"]["starsAverage"] == 0.0:
-                        product_rating = '0/5'
-                    else:
-                        product_rating = str(get_rating_details.json()[
-                                             "productReviewsSummary"]["starsAverage"]) + '/5'
-                else:
-                    product_rating = '0/5'
+                rating = await get_ratings_service().get_rating(
+                    trustpilot_trustbox(template_id, business_unit_id, locale), sku)
+                product_rating = format_rating(rating)
 
             else:
                 product_rating = '0/5'
@@ -16,6 +16,7 @@ class DirectVetETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#center_column'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.extraction_script = 'directvet.js'
 
     def extract(self, category):
         current_url = f"{self.BASE_URL}/{category}"
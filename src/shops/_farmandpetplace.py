@@ -1,9 +1,9 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..ratings import get_ratings_service, feefo_summary
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -16,6 +16,8 @@ class FarmAndPetPlaceETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '.content-page'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.rating_source = feefo_summary(
+            "farm-pet-place", "www.farmandpetplace.co.uk")
         self.category_urls = []
         self.scrape_url_again = []
         self.scraped_urls = set()
@@ -120,6 +122,9 @@ class FarmAndPetPlaceETL(PetProductsETL):
         return df
 
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find('h1', attrs={'itemprop': 'name'})
             if product_name:
@@ -137,18 +142,8 @@ class FarmAndPetPlaceETL(PetProductsETL):
             product_id = soup.find(
                 'div', class_="ruk_rating_snippet").get('data-sku')
 
-            try:
-                rating_wrapper = requests.get(
-                    f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=farm-pet-place&origin=www.farmandpetplace.co.uk")
-
-                if rating_wrapper.status_code == 200 and rating_wrapper.json().get('rating', {}).get('rating'):
-                    rating = float(rating_wrapper.json()['rating']['rating'])
-                    product_rating = f'{rating}/5'
-                else:
-                    product_rating = '0/5'
-
-            except (requests.RequestException, KeyError, ValueError, TypeError):
-                product_rating = '0/5'
+            rating = await get_ratings_service().get_rating(self.rating_source, product_id)
+            product_rating = f'{rating}/5' if rating else '0/5'
 
             variants = []
             prices = []
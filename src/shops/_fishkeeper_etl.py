@@ -1,12 +1,14 @@
 import asyncio
 import random
-import json
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
-from bs4 import BeautifulSoup
+from ..html_parser import make_soup
+from ..ratings import get_ratings_service, feefo_product_ratings
+from ..structured_data import StructuredPage, LD_JSON
+from ..resource_policy import LEAN_POLICY
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
+from ..browser_manager import browser_session
+from ..scraper import paced_goto
 from loguru import logger
 
 
@@ -18,18 +20,18 @@ class FishKeeperETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#maincontent'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.structured_data_blocks = (LD_JSON,)
+        self.resource_policy = LEAN_POLICY
+        self.rating_source = feefo_product_ratings("maidenhead-aquatics")
 
     async def product_list_scroll(self, url, selector):
         soup = None
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
+            async with browser_session(
+                url,
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"]
+            ) as browser:
                 context = await browser.new_context(
                     user_agent=UserAgent().random,
                     viewport={"width": random.randint(
@@ -45,7 +47,7 @@ class FishKeeperETL(PetProductsETL):
                     "Referer": url,
                 })
 
-                await page.goto(url, wait_until="domcontentloaded")
+                await paced_goto(page, url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
                 logger.info(
@@ -69,16 +71,12 @@ class FishKeeperETL(PetProductsETL):
                 sleep_time = random.uniform(
                     2, 5)
                 logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
+                soup = make_soup(rendered_html)
                 return soup.find('ol', class_="ais-InfiniteHits-list")
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         url = self.BASE_URL + category
 
@@ -91,22 +89,15 @@ class FishKeeperETL(PetProductsETL):
         df.insert(0, "shop", self.SHOP)
         return df
 
-    def transform(self,  soup: BeautifulSoup, url: str):
+    def transform(self, page: StructuredPage, url: str):
+        return asyncio.run(self.transform_async(page, url))
+
+    async def transform_async(self, page: StructuredPage, url: str):
         try:
-            data = json.loads(soup.select_one(
-                "script[type*='application/ld+json']").text)
+            data = page.find_ld_json("mpn", "offers")
             product_title = data["name"]
 
-            rating = 0
-            sku = data["mpn"]
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/products/ratings?merchant_identifier=maidenhead-aquatics&review_count=true&product_sku={sku}")
-            if rating_wrapper.status_code == 200:
-                json_data = rating_wrapper.json()
-                products = json_data.get('products', [])
-
-                if products and 'rating' in products[0]:
-                    rating = float(products[0]['rating'])
+            rating = await get_ratings_service().get_rating(self.rating_source, data["mpn"]) or 0
 
             description = data["description"]
             product_url = url.replace(self.BASE_URL, "")
@@ -1,15 +1,16 @@
 import asyncio
 import pandas as pd
-import json
 import math
 import re
 import random
 from ..etl import PetProductsETL
-from bs4 import BeautifulSoup
+from ..html_parser import make_soup
+from ..structured_data import StructuredPage, LD_JSON
 from loguru import logger
 
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
+from ..browser_manager import browser_session
+from ..scraper import paced_goto
 
 
 class JollyesETL(PetProductsETL):
@@ -21,18 +22,16 @@ class JollyesETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 4
         self.browser_type = 'chromium'
+        self.structured_data_blocks = (LD_JSON,)
 
     async def product_list_scrolling(self, url, selector, click_times):
         soup = None
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
+            async with browser_session(
+                url,
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"]
+            ) as browser:
                 context = await browser.new_context(
                     user_agent=UserAgent().random,
                     viewport={"width": random.randint(
@@ -48,7 +47,7 @@ class JollyesETL(PetProductsETL):
                     "Referer": url,
                 })
 
-                await page.goto(url, wait_until="load")
+                await paced_goto(page, url, wait_until="load")
                 await page.wait_for_selector(selector, timeout=60000)
 
                 logger.info(
@@ -87,16 +86,12 @@ class JollyesETL(PetProductsETL):
                 sleep_time = random.uniform(
                     3, 5)
                 logger.info(f"Sleeping for {sleep_time} seconds...")
-                soup = BeautifulSoup(rendered_html, "html.parser")
+                soup = make_soup(rendered_html)
                 return soup.find_all('a', class_="product-link")
 
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         category_link = f"{self.BASE_URL}/{category}.html"
         soup = asyncio.run(self.scrape(
@@ -144,10 +139,9 @@ class JollyesETL(PetProductsETL):
         df.insert(0, "shop", self.SHOP)
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    def transform(self, page: StructuredPage, url: str):
         try:
-            data = json.loads(soup.select_one(
-                "section[class*='lazy-review-section']").select_one("script[type*='application']").text)
+            data = page.find_ld_json("name", "offers")
             product_title = data["name"]
             description = data["description"]
 
@@ -1,13 +1,15 @@
 import asyncio
 import random
 import time
-import json
 import pandas as pd
 
 from ..etl import PetProductsETL
-from bs4 import BeautifulSoup
+from ..html_parser import make_soup
+from ..structured_data import StructuredPage, LD_JSON, INITIAL_STATE, META
+from ..resource_policy import LEAN_POLICY
 from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
+from ..browser_manager import browser_session
+from ..scraper import paced_goto
 from loguru import logger
 
 
@@ -19,17 +21,16 @@ class OcadoETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#main'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.structured_data_blocks = (LD_JSON, INITIAL_STATE, META)
+        self.resource_policy = LEAN_POLICY
 
     async def product_list_scrolling(self, url, selector, timeout: int = 60):
-        browser = None
         try:
-            async with async_playwright() as p:
-                browser_args = {
-                    "headless": True,
-                    "args": ["--disable-blink-features=AutomationControlled"]
-                }
-
-                browser = await p.chromium.launch(**browser_args)
+            async with browser_session(
+                url,
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"]
+            ) as browser:
                 context = await browser.new_context(
                     user_agent=UserAgent().random,
                     viewport={
@@ -47,7 +48,7 @@ class OcadoETL(PetProductsETL):
                     "Referer": url,
                 })
 
-                await page.goto(url, wait_until="domcontentloaded")
+                await paced_goto(page, url, wait_until="domcontentloaded")
                 await page.wait_for_selector(selector, timeout=30000)
 
                 logger.info("Starting infinite scroll scrape...")
@@ -66,7 +67,7 @@ class OcadoETL(PetProductsETL):
                         html = await card.inner_html()
                         if html not in seen_cards:
                             seen_cards.add(html)
-                            soup_card = BeautifulSoup(html, "html.parser")
+                            soup_card = make_soup(html)
                             product_card_soups.append(
                                 soup_card.find('a').get('href'))
 
@@ -97,10 +98,6 @@ class OcadoETL(PetProductsETL):
         except Exception as e:
             logger.error(f"An error occurred: {e}")
 
-        finally:
-            if browser:
-                await browser.close()
-
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
 
@@ -113,10 +110,10 @@ class OcadoETL(PetProductsETL):
         df.insert(0, "shop", self.SHOP)
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    def transform(self, page: StructuredPage, url: str):
         try:
-            details = json.loads(soup.find(
-                'script', attrs={'data-test': 'product-details-structured-data'}).get_text())
+            details = page.find_ld_json(
+                attrs={'data-test': 'product-details-structured-data'})
 
             product_name = details['name']
             product_description = details['description']
@@ -127,16 +124,13 @@ class OcadoETL(PetProductsETL):
                 product_rating = str(
                     int(float(details['aggregateRating']['ratingValue']))) + '/5'
 
-            price_details = json.loads(soup.find('script', attrs={
-                                       'data-test': 'initial-state-script'}).get_text().replace('window.__INITIAL_STATE__=', ''))
+            price_details = page.initial_state
             variant = details.get("brand", "") + " - " + \
                 details.get("size", "")
             price = None
             discounted_price = None
             discount_percentage = None
-            image_urls = "https://www.ocado.com" + \
-                soup.find('meta', attrs={'property': "og:image"}).get(
-                    'content')
+            image_urls = "https://www.ocado.com" + page.meta["og:image"]
 
             product_entities = price_details["data"]["products"]["productEntities"]
             price_data = product_entities[next(
@@ -1,9 +1,9 @@
 import asyncio
-import requests
 import json
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..ratings import get_ratings_service, feefo_summary, format_rating
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -16,6 +16,8 @@ class OrijenETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = 'form.variations_form'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.rating_source = feefo_summary(
+            "orijen-pet-foods", "www.orijenpetfoods.co.uk")
 
     def extract(self, category):
         url = self.BASE_URL+category
@@ -30,6 +32,9 @@ class OrijenETL(PetProductsETL):
             return df
 
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find('h1', class_="product_title").get_text()
             product_description = soup.find(
@@ -39,10 +44,8 @@ class OrijenETL(PetProductsETL):
             product_id = soup.find(
                 'input', attrs={'name': 'product_id'}).get('value')
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/reviews/summary/product?since_period=ALL&parent_product_sku={product_id}&merchant_identifier=orijen-pet-foods&origin=www.orijenpetfoods.co.uk")
-            rating = rating_wrapper.json()['rating']['rating']
-            product_rating = f'{rating}/5'
+            rating = await get_ratings_service().get_rating(self.rating_source, product_id)
+            product_rating = format_rating(rating)
 
             variants = []
             prices = []
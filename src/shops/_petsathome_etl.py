@@ -1,10 +1,12 @@
 import json
 import math
 import asyncio
+import hashlib
 import pandas as pd
 
 from ..etl import PetProductsETL
-from bs4 import BeautifulSoup
+from ..structured_data import StructuredPage, NEXT_DATA
+from ..resource_policy import LEAN_POLICY
 from loguru import logger
 
 
@@ -16,6 +18,8 @@ class PetsAtHomeETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = ''
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.structured_data_blocks = (NEXT_DATA,)
+        self.resource_policy = LEAN_POLICY
 
     def extract(self, category):
         urls = []
@@ -70,11 +74,27 @@ class PetsAtHomeETL(PetProductsETL):
 
         return df
 
-    def transform(self, soup: BeautifulSoup, url: str):
+    def get_content_fingerprint(self, page: StructuredPage):
+        # __NEXT_DATA__ also carries build ids and tracking state, so only the
+        # product props that transform reads are hashed
+        if not page.next_data:
+            return None
+
+        # Error and redirect pages carry a __NEXT_DATA__ without product props
+        page_props = (page.next_data.get("props") or {}).get("pageProps")
+        if not page_props:
+            return None
+
+        fingerprint = json.dumps({
+            "baseProduct": page_props.get("baseProduct"),
+            "productRating": page_props.get("productRating")
+        }, sort_keys=True)
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def transform(self, page: StructuredPage, url: str):
         try:
             # Get the data from encoded JSON
-            product_data = soup.select_one("[id='__NEXT_DATA__']")
-            product_data_dict = json.loads(product_data.text)
+            product_data_dict = page.next_data
 
             # Get base details
             product_title = product_data_dict["props"]["pageProps"]["baseProduct"]["name"]
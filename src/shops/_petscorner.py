@@ -1,8 +1,8 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from ..ratings import get_ratings_service, feefo_summary, format_rating
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -15,6 +15,10 @@ class PetsCornerETL(PetProductsETL):
         self.SELECTOR_SCRAPE_PRODUCT_INFO = '#content'
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
+        self.parent_rating_source = feefo_summary(
+            "pets-corner", "www.petscorner.co.uk", imported=True)
+        self.rating_source = feefo_summary(
+            "pets-corner", "www.petscorner.co.uk", sku_param="product_sku", imported=True)
 
     def extract(self, category):
         category_link = f"{self.BASE_URL}{category}"
@@ -57,6 +61,9 @@ class PetsCornerETL(PetProductsETL):
         return df
 
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find('h1', class_="product-name").get_text()
             product_description = None
@@ -69,18 +76,16 @@ class PetsCornerETL(PetProductsETL):
             product_rating = '0/5'
             product_id = soup.find_all(
                 'div', class_="notify-stock")[-1].get('data-productid')
-            sku = None
             sku_tag = soup.find('div', id="feefo-product-review-widgetId")
             if sku_tag.get('data-parent-product-sku'):
-                sku = f"parent_product_sku={sku_tag.get('data-parent-product-sku')}"
+                rating = await get_ratings_service().get_rating(
+                    self.parent_rating_source, sku_tag.get('data-parent-product-sku'))
             else:
-                sku = f"product_sku={sku_tag.get('data-product-sku')}"
+                rating = await get_ratings_service().get_rating(
+                    self.rating_source, sku_tag.get('data-product-sku'))
 
-            rating_wrapper = requests.get(
-                f"https://api.feefo.com/api/10/importedreviews/summary/product?since_period=ALL&{sku}&merchant_identifier=pets-corner&origin=www.petscorner.co.uk")
-            if rating_wrapper.status_code == 200:
-                product_rating = str(rating_wrapper.json()[
-                                     'rating']['rating']) + '/5'
+            if rating is not None:
+                product_rating = format_rating(rating)
 
             variants = []
             prices = []
@@ -1,10 +1,10 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 
 from ..etl import PetProductsETL
+from ..http_client import http_get_async
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -49,7 +49,17 @@ class PetShopETL(PetProductsETL):
 
         return df
 
+    def get_items_api_url(self, url):
+        product_url = url.replace(self.BASE_URL, "")
+        return f"https://www.petshop.co.uk/api/cacheable/items?c=3934951&country=GB&currency=GBP&fieldset=details&include=facets&language=en&n=2&pricelevel=5&url={product_url.replace('/', '')}&use_pcv=T"
+
+    def get_revalidation_request(self, url):
+        return self.get_items_api_url(url), None
+
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find('h1', class_="product-details-full-content-header-title").find(
                 string=True, recursive=False).get_text(strip=True)
@@ -93,8 +103,7 @@ class PetShopETL(PetProductsETL):
             image_urls.append(', '.join([img.find('img').get(
                 'src') for img in soup.find('ul', class_="bxslider").find_all('li')]))
 
-            get_price_details = requests.get(
-                f"https://www.petshop.co.uk/api/cacheable/items?c=3934951&country=GB&currency=GBP&fieldset=details&include=facets&language=en&n=2&pricelevel=5&url={product_url.replace('/', '')}&use_pcv=T")
+            get_price_details = await http_get_async(self.get_items_api_url(url))
             if get_price_details.status_code == 200:
                 product_info = get_price_details.json()['items'][0]
                 if product_info.get('pricelevel2') is not None:
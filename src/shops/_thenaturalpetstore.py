@@ -1,9 +1,9 @@
 import math
 import asyncio
-import requests
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..http_client import http_get_async
 from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 from loguru import logger
@@ -38,7 +38,13 @@ class TheNaturalPetStoreETL(PetProductsETL):
             df.insert(0, "shop", self.SHOP)
             return df
 
+    def get_revalidation_request(self, url):
+        return url, {'Accept': 'application/json'}
+
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find(
                 'h1', class_="product-meta__title").get_text()
@@ -72,7 +78,7 @@ class TheNaturalPetStoreETL(PetProductsETL):
                 'Accept': 'application/json'
             }
 
-            product_info = requests.get(url, headers=headers)
+            product_info = await http_get_async(url, headers=headers)
 
             for variant_info in product_info.json()['product']["variants"]:
                 variants.append(variant_info.get('title'))
@@ -1,16 +1,15 @@
 import os
 import asyncio
 import json
-import random
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..html_parser import make_soup
 from bs4 import BeautifulSoup
 from loguru import logger
-from fake_useragent import UserAgent
-from playwright.async_api import async_playwright
 from datetime import datetime as dt
-from patchright.async_api import async_playwright as patch_async_playwright
+from ..browser_manager import browser_session, PATCHRIGHT
+from ..scraper import paced_goto
 
 
 class TheRangeETL(PetProductsETL):
@@ -22,79 +21,43 @@ class TheRangeETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
         self.browser_type = "chromium"
+        # transform drives its own browser, which a pool worker must not do
+        self.offload_transform = False
 
     async def scrape_product_page(self, url, selector):
         logger.info(f"Navigating to: {url}")
         profile_dir = os.path.abspath("chrome_user_data")
-        async with patch_async_playwright() as p:
-            context = await p.chromium.launch_persistent_context(
-                user_data_dir=profile_dir,
-                channel="chrome",
-                headless=False,
-                no_viewport=True
-            )
+        async with browser_session(
+            url,
+            driver=PATCHRIGHT,
+            user_data_dir=profile_dir,
+            channel="chrome",
+            headless=False,
+            no_viewport=True
+        ) as context:
             page = context.pages[0]
-            await page.goto(url)
+            await paced_goto(page, url, self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
             await page.wait_for_selector(selector)
             html = await page.content()
             # Interact with the page...
-            await context.close()
         logger.success(f"Successfully extracted content from {url}")
-        return BeautifulSoup(html, "html.parser")
+        return make_soup(html)
 
     async def get_data_variant(self, url):
-        browser = None
-        data = None
-
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"]
-                )
-
-                context = await browser.new_context(
-                    user_agent=UserAgent().random,
-                    viewport={"width": random.randint(
-                        1200, 1600), "height": random.randint(800, 1200)},
-                    locale="en-US"
-                )
-
-                page = await context.new_page()
-
-                # Capture first JSON response
-                async def handle_response(response):
-                    nonlocal data
-                    try:
-                        if "application/json" in response.headers.get("content-type", "") and response.status == 200:
-                            json_data = await response.json()
-                            logger.info(f"Captured JSON from: {response.url}")
-                            data = json_data
-                    except Exception as e:
-                        logger.error(f"Failed to parse JSON: {e}")
-
-                page.on("response", handle_response)
-
-                await page.set_extra_http_headers({
-                    "User-Agent": UserAgent().random,
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Origin": "https://www.therange.co.uk",
-                    "Referer": url,
-                })
-
-                await page.goto(url, wait_until="networkidle")
-
-                sleep_time = random.uniform(2, 5)
-                logger.info(f"Sleeping for {sleep_time:.2f} seconds...")
-                await asyncio.sleep(sleep_time)
-
-                return data
-
-        except Exception as e:
-            logger.error(f"An error occurred: {e}")
-        finally:
-            if browser:
-                await browser.close()
+        captured = await self.capture(
+            url,
+            ["search.therange.co.uk/api/productlist"],
+            headers={
+                "Origin": "https://www.therange.co.uk",
+                "Referer": url,
+            },
+            wait_until="networkidle",
+            min_sec=self.MIN_SEC_SLEEP_PRODUCT_INFO,
+            max_sec=self.MAX_SEC_SLEEP_PRODUCT_INFO,
+            browser='chromium'
+        )
+
+        return captured[0].data if captured else None
 
     def extract(self, category):
         category_link = f"https://www.therange.co.uk{category}"
@@ -1,8 +1,8 @@
 import asyncio
 import math
-import requests
 import pandas as pd
 from ..etl import PetProductsETL
+from ..http_client import http_get_async
 from bs4 import BeautifulSoup
 from loguru import logger
 
@@ -46,7 +46,17 @@ class VetShopETL(PetProductsETL):
 
         return df
 
+    def get_items_api_url(self, url):
+        product_url = url.replace(self.BASE_URL, "")
+        return f"https://www.vetshop.co.uk/api/items?c=3934951&country=GB&currency=GBP&fields=pricelevel4%2Cpricelevel4_formatted&fieldset=details&include=facets&language=en&n=3&pricelevel=4&url={product_url.replace('/', '')}"
+
+    def get_revalidation_request(self, url):
+        return self.get_items_api_url(url), None
+
     def transform(self, soup: BeautifulSoup, url: str):
+        return asyncio.run(self.transform_async(soup, url))
+
+    async def transform_async(self, soup: BeautifulSoup, url: str):
         try:
             product_name = soup.find(
                 'h1', class_="item-details-content-header-title").find(string=True, recursive=False).get_text()
@@ -104,8 +114,7 @@ class VetShopETL(PetProductsETL):
                     price = float(soup.find_all(
                         'p', class_="item-views-blb-price-option-price")[1].get_text().replace('£', ''))
                 else:
-                    get_price_details = requests.get(
-                        f"https://www.vetshop.co.uk/api/items?c=3934951&country=GB&currency=GBP&fields=pricelevel4%2Cpricelevel4_formatted&fieldset=details&include=facets&language=en&n=3&pricelevel=4&url={product_url.replace('/', '')}")
+                    get_price_details = await http_get_async(self.get_items_api_url(url))
                     if get_price_details.status_code == 200:
                         product_info = get_price_details.json()['items'][0]
 
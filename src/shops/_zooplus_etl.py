@@ -1,12 +1,10 @@
 import asyncio
-import requests
 import re
-import random
 import json
-import time
 import pandas as pd
 
 from ..etl import PetProductsETL
+from ..http_client import conditional_get, remember_validators
 from bs4 import BeautifulSoup
 from loguru import logger
 from fake_useragent import UserAgent
@@ -21,20 +19,20 @@ class ZooplusETL(PetProductsETL):
         self.MIN_SEC_SLEEP_PRODUCT_INFO = 1
         self.MAX_SEC_SLEEP_PRODUCT_INFO = 2
         self.with_proxy = True
+        self.partial_parse = True
+        self.scoped_content = True
 
     def get_product_links(self, url, headers):
         try:
             # Parse request response
-            response = requests.get(url=url, headers=headers)
+            response = conditional_get(
+                url, headers=headers, min_interval=self.MIN_SEC_SLEEP_PRODUCT_INFO, max_interval=self.MAX_SEC_SLEEP_PRODUCT_INFO)
             response.raise_for_status()
+            remember_validators(url, response)
 
             logger.info(
                 f"Successfully extracted data from {url} {response.status_code}"
             )
-            sleep_time = random.uniform(
-                self.MIN_SEC_SLEEP_PRODUCT_INFO, self.MAX_SEC_SLEEP_PRODUCT_INFO)
-            time.sleep(sleep_time)
-            logger.info(f"Sleeping for {sleep_time} seconds...")
             return response
 
         except Exception as e:
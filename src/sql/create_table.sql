@@ -56,6 +56,34 @@ CREATE TABLE urls (
     ,updated_date datetime
 );
 
+DROP TABLE IF EXISTS url_validators;
+CREATE TABLE url_validators (
+    url_hash char(64) NOT NULL PRIMARY KEY
+    ,url text CHARACTER SET utf8mb4
+    ,etag varchar(255) CHARACTER SET utf8mb4
+    ,last_modified varchar(50) CHARACTER SET utf8mb4
+    ,updated_date datetime
+);
+
+DROP TABLE IF EXISTS url_content_hashes;
+CREATE TABLE url_content_hashes (
+    url_hash char(64) NOT NULL PRIMARY KEY
+    ,shop varchar(50) CHARACTER SET utf8mb4
+    ,url text CHARACTER SET utf8mb4
+    ,content_hash char(64)
+    ,updated_date datetime
+    ,verified_date datetime
+);
+
+DROP TABLE IF EXISTS shop_fetch_state;
+CREATE TABLE shop_fetch_state (
+    shop varchar(50) CHARACTER SET utf8mb4 NOT NULL
+    ,name varchar(50) CHARACTER SET utf8mb4 NOT NULL
+    ,value varchar(255) CHARACTER SET utf8mb4
+    ,updated_date datetime
+    ,PRIMARY KEY (shop, name)
+);
+
 DROP TABLE IF EXISTS stg_pet_products;
 CREATE TABLE stg_pet_products (
     shop varchar(50) CHARACTER SET utf8mb4
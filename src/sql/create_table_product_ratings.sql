@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS product_ratings (
+    source VARCHAR(100) NOT NULL,
+    sku_hash CHAR(64) NOT NULL,
+    sku TEXT,
+    rating FLOAT,
+    updated_date datetime,
+    PRIMARY KEY (source, sku_hash)
+);
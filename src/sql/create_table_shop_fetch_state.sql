@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS shop_fetch_state (
+    shop VARCHAR(50) NOT NULL,
+    name VARCHAR(50) NOT NULL,
+    value VARCHAR(255),
+    updated_date datetime,
+    PRIMARY KEY (shop, name)
+);
@@ -0,0 +1,8 @@
+CREATE TABLE IF NOT EXISTS url_content_hashes (
+    url_hash CHAR(64) NOT NULL PRIMARY KEY,
+    shop VARCHAR(50),
+    url TEXT,
+    content_hash CHAR(64),
+    updated_date datetime,
+    verified_date datetime
+);
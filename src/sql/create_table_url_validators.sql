@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS url_validators (
+    url_hash CHAR(64) NOT NULL PRIMARY KEY,
+    url TEXT,
+    etag VARCHAR(255),
+    last_modified VARCHAR(50),
+    updated_date datetime
+);
@@ -0,0 +1 @@
+SELECT sku, rating FROM product_ratings WHERE source='{source}' AND updated_date >= '{since}';
@@ -0,0 +1 @@
+SELECT value, updated_date FROM shop_fetch_state WHERE shop='{shop}' AND name='{name}';
@@ -1 +1 @@
-SELECT DISTINCT id, url FROM {table_name} WHERE scrape_status<>'DONE' AND shop='{shop}';
\ No newline at end of file
+SELECT DISTINCT id, url, scrape_status = 'UNAVAILABLE' AS unavailable FROM {table_name} WHERE scrape_status NOT IN ('DONE', 'UNCHANGED') AND shop='{shop}' ORDER BY unavailable, id;
\ No newline at end of file
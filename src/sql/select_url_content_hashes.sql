@@ -0,0 +1 @@
+SELECT url_hash, content_hash FROM url_content_hashes WHERE shop='{shop}';
@@ -0,0 +1 @@
+SELECT etag, last_modified FROM url_validators WHERE url_hash='{url_hash}';
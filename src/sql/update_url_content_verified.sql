@@ -0,0 +1,3 @@
+UPDATE url_content_hashes
+SET verified_date='{timestamp}'
+WHERE url_hash='{url_hash}'
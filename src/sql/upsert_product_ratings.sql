@@ -0,0 +1,5 @@
+INSERT INTO product_ratings (source, sku_hash, sku, rating, updated_date)
+VALUES {values}
+ON DUPLICATE KEY UPDATE
+    rating=VALUES(rating)
+    ,updated_date=VALUES(updated_date);
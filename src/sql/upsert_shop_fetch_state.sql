@@ -0,0 +1,5 @@
+INSERT INTO shop_fetch_state (shop, name, value, updated_date)
+VALUES ('{shop}', '{name}', '{value}', '{timestamp}')
+ON DUPLICATE KEY UPDATE
+    value=VALUES(value)
+    ,updated_date=VALUES(updated_date);
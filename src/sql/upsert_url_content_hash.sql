@@ -0,0 +1,6 @@
+INSERT INTO url_content_hashes (url_hash, shop, url, content_hash, updated_date, verified_date)
+VALUES ('{url_hash}', '{shop}', '{url}', '{content_hash}', '{timestamp}', '{timestamp}')
+ON DUPLICATE KEY UPDATE
+    content_hash=VALUES(content_hash)
+    ,updated_date=VALUES(updated_date)
+    ,verified_date=VALUES(verified_date);
@@ -0,0 +1,6 @@
+INSERT INTO url_validators (url_hash, url, etag, last_modified, updated_date)
+VALUES ('{url_hash}', '{url}', {etag}, {last_modified}, '{timestamp}')
+ON DUPLICATE KEY UPDATE
+    etag=VALUES(etag)
+    ,last_modified=VALUES(last_modified)
+    ,updated_date=VALUES(updated_date);
@@ -0,0 +1,115 @@
+import re
+import json
+import html
+import hashlib
+
+from typing import Optional, Dict, Any, List, Iterable
+
+LD_JSON = "ld_json"
+NEXT_DATA = "next_data"
+INITIAL_STATE = "initial_state"
+META = "meta"
+BLOCKS = (LD_JSON, NEXT_DATA, INITIAL_STATE, META)
+
+SCRIPT_PATTERN = re.compile(
+    r"<script\b([^>]*)>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+META_PATTERN = re.compile(r"<meta\b([^>]*)>", re.IGNORECASE)
+ATTR_PATTERN = re.compile(
+    r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+INITIAL_STATE_PATTERN = re.compile(r"^\s*window\.__INITIAL_STATE__\s*=\s*")
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+def parse_attrs(raw: str) -> Dict[str, str]:
+    return {
+        name.lower(): html.unescape(next(v for v in values if v is not None))
+        for name, *values in ATTR_PATTERN.findall(raw)
+    }
+
+
+def _load_json(text: str) -> Optional[Any]:
+    # raw_decode tolerates trailing statements such as the ';' after an assignment
+    try:
+        return _decoder.raw_decode(text.strip())[0]
+    except ValueError:
+        return None
+
+
+class StructuredPage:
+    """Embedded JSON blocks of a page, scanned from the raw HTML without building a DOM.
+
+    Only the requested ``blocks`` are parsed: ``ld_json`` (every JSON-LD script),
+    ``next_data`` (Next.js ``__NEXT_DATA__``), ``initial_state``
+    (``window.__INITIAL_STATE__``) and ``meta`` (meta tags by property or name).
+    The page is falsy when one of the requested script blocks is missing.
+    """
+
+    def __init__(self, page_html: str, blocks: Iterable[str] = BLOCKS):
+        self.blocks = tuple(blocks)
+        self.ld_json: List[Dict[str, Any]] = []
+        self.next_data: Optional[Dict[str, Any]] = None
+        self.initial_state: Optional[Dict[str, Any]] = None
+        self.meta: Dict[str, str] = {}
+
+        if any(block != META for block in self.blocks):
+            self._scan_scripts(page_html)
+
+        if META in self.blocks:
+            for raw_attrs in META_PATTERN.findall(page_html):
+                attrs = parse_attrs(raw_attrs)
+                key = attrs.get("property") or attrs.get("name")
+                if key and "content" in attrs:
+                    self.meta.setdefault(key, attrs["content"])
+
+    def _scan_scripts(self, page_html: str) -> None:
+        for raw_attrs, body in SCRIPT_PATTERN.findall(page_html):
+            attrs = parse_attrs(raw_attrs)
+
+            if LD_JSON in self.blocks and "ld+json" in attrs.get("type", ""):
+                data = _load_json(body)
+                if data is not None:
+                    self.ld_json.append({"attrs": attrs, "data": data})
+
+            elif NEXT_DATA in self.blocks and attrs.get("id") == "__NEXT_DATA__":
+                self.next_data = _load_json(body)
+
+            elif INITIAL_STATE in self.blocks and INITIAL_STATE_PATTERN.match(body):
+                self.initial_state = _load_json(
+                    INITIAL_STATE_PATTERN.sub("", body, count=1))
+
+    def find_ld_json(self, *keys: str, attrs: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """First JSON-LD object holding every key in ``keys``, from a script with the given attributes"""
+        for block in self.ld_json:
+            if attrs and any(block["attrs"].get(k) != v for k, v in attrs.items()):
+                continue
+
+            data = block["data"]
+            candidates = data if isinstance(data, list) else [data]
+            for candidate in candidates:
+                graph = candidate.get("@graph") if isinstance(candidate, dict) else None
+                for item in graph if isinstance(graph, list) else [candidate]:
+                    if isinstance(item, dict) and all(key in item for key in keys):
+                        return item
+
+        return None
+
+    def missing_blocks(self) -> List[str]:
+        found = {
+            LD_JSON: bool(self.ld_json),
+            NEXT_DATA: self.next_data is not None,
+            INITIAL_STATE: self.initial_state is not None,
+        }
+        return [block for block in self.blocks if block in found and not found[block]]
+
+    def __bool__(self) -> bool:
+        return not self.missing_blocks()
+
+    def fingerprint(self) -> str:
+        content = json.dumps({
+            LD_JSON: [block["data"] for block in self.ld_json],
+            NEXT_DATA: self.next_data,
+            INITIAL_STATE: self.initial_state,
+            META: self.meta
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
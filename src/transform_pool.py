@@ -0,0 +1,124 @@
+import os
+import asyncio
+import importlib
+import multiprocessing
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
+from dotenv import load_dotenv
+from loguru import logger
+from .html_parser import make_soup
+
+load_dotenv()
+
+TRANSFORM_WORKERS = int(os.getenv("TRANSFORM_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+
+
+@dataclass
+class TransformResult:
+    """What a pool worker sends back for one product page: plain values only, so it pickles cheaply.
+
+    ``found`` is False when the page lacks the product selector (or the
+    shop's structured data), in which case nothing else is set. ``columns``
+    and ``records`` are None when transform returned None or was skipped
+    because the content hash matched.
+    """
+    found: bool
+    content_hash: Optional[str] = None
+    columns: Optional[List[str]] = None
+    records: Optional[List[Dict[str, Any]]] = None
+
+    def to_frame(self) -> Optional[pd.DataFrame]:
+        if self.records is None:
+            return None
+        return pd.DataFrame.from_records(self.records, columns=self.columns)
+
+
+# One instance of each shop per worker process, built on first use
+_shops: Dict[str, Any] = {}
+
+
+def _get_shop(module: str, class_name: str):
+    key = f"{module}.{class_name}"
+    if key not in _shops:
+        _shops[key] = getattr(importlib.import_module(module), class_name)()
+    return _shops[key]
+
+
+def transform_html(module: str, class_name: str, html: str, url: str,
+                   known_hash: Optional[str] = None, require_selector: bool = False) -> TransformResult:
+    """Parse the page, fingerprint it and run the shop's transform on it.
+
+    Runs in a pool worker, or in the caller's process as a fallback. The
+    transform is skipped when the fingerprint equals ``known_hash``.
+    """
+    shop = _get_shop(module, class_name)
+
+    if shop.structured_data_blocks:
+        page = shop.parse_structured_data(html)
+        found = bool(page)
+    else:
+        page = make_soup(html, shop.get_parse_only(), shop.html_parser)
+        found = not require_selector or page.select_one(shop.SELECTOR_SCRAPE_PRODUCT_INFO) is not None
+
+    if not found:
+        return TransformResult(False)
+
+    content_hash = shop.get_content_fingerprint(page)
+    if known_hash and content_hash == known_hash:
+        return TransformResult(True, content_hash)
+
+    df = shop.transform(page, url)
+    if df is None:
+        return TransformResult(True, content_hash)
+
+    return TransformResult(True, content_hash, [str(column) for column in df.columns], df.to_dict("records"))
+
+
+_transform_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_transform_pool() -> Optional[ProcessPoolExecutor]:
+    """The worker-wide process pool, or None if TRANSFORM_WORKERS is 0"""
+    global _transform_pool
+
+    if _transform_pool is None and TRANSFORM_WORKERS > 0:
+        # Spawned, not forked: by now the worker runs logging and executor threads and
+        # the Playwright driver, whose locks and pipes a forked child would inherit
+        _transform_pool = ProcessPoolExecutor(
+            max_workers=TRANSFORM_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Started transform pool with {TRANSFORM_WORKERS} process(es)")
+
+    return _transform_pool
+
+
+def shutdown_transform_pool() -> None:
+    global _transform_pool
+
+    if _transform_pool is not None:
+        _transform_pool.shutdown(cancel_futures=True)
+        _transform_pool = None
+
+
+async def run_transform(shop, html: str, url: str, known_hash: Optional[str] = None,
+                        require_selector: bool = False) -> TransformResult:
+    """Transform the raw HTML in the process pool while the event loop keeps navigating.
+
+    If a worker dies (e.g. killed for memory) the pool is dropped and the page
+    is transformed in this process instead.
+    """
+    args = (type(shop).__module__, type(shop).__name__, html, url, known_hash, require_selector)
+
+    pool = get_transform_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, transform_html, *args)
+        except BrokenProcessPool as e:
+            logger.error(f"Transform pool broke, transforming {url} in process: {e}")
+            shutdown_transform_pool()
+
+    _shops.setdefault(f"{args[0]}.{args[1]}", shop)
+    return transform_html(*args)